@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+
+from utils.sorting_algorithms import SortingAlgorithms
+from utils.searching_algorithms import SearchingAlgorithms
+from utils.graph_algorithms import GraphAlgorithms
+from utils.dynamic_programming import DynamicProgramming
+
+def main():
+    ''' Run each benchmark '''
+    algorithm_classes = [
+        ("SortingAlgorithms", SortingAlgorithms),
+        ("SearchingAlgorithms", SearchingAlgorithms),
+        ("GraphAlgorithms", GraphAlgorithms),
+        ("DynamicProgramming", DynamicProgramming),
+    ]
+
+    for name, algorithm_class in algorithm_classes:
+        print("Running {} benchmarks.".format(name))
+        algorithm_class.benchmark()
+        print('\n', end="")
+
+if __name__ == "__main__":
+    main()
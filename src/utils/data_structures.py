@@ -1,5 +1,7 @@
 # data_structures.py
 
+import array
+
 class DataStructures:
     """
     ### Data Structure-Based Algorithms:
@@ -252,28 +254,38 @@ class DataStructures:
     # Union-Find / Disjoint Set Union (DSU)
     class UnionFind:
         def __init__(self, n):
-            """Union-Find (Disjoint Set Union) initialization."""
-            self.parent = list(range(n))
-            self.rank = [1] * n
+            """Union-Find (Disjoint Set Union) initialization, backed by flat arrays."""
+            self.parent = array.array('l', range(n))
+            self.rank = bytearray(n)
+            self.components = n
 
         def find(self, x):
-            """Find the representative of the set that contains x."""
-            if self.parent[x] != x:
-                self.parent[x] = self.find(self.parent[x])
-            return self.parent[x]
+            """Find the representative of the set that contains x (iterative path halving)."""
+            parent = self.parent
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
 
         def union(self, x, y):
-            """Union the sets containing x and y."""
+            """Union the sets containing x and y; returns False if they were already joined."""
             rootX = self.find(x)
             rootY = self.find(y)
-            if rootX != rootY:
-                if self.rank[rootX] > self.rank[rootY]:
-                    self.parent[rootY] = rootX
-                elif self.rank[rootX] < self.rank[rootY]:
-                    self.parent[rootX] = rootY
-                else:
-                    self.parent[rootY] = rootX
-                    self.rank[rootX] += 1
+            if rootX == rootY:
+                return False
+            if self.rank[rootX] > self.rank[rootY]:
+                self.parent[rootY] = rootX
+            elif self.rank[rootX] < self.rank[rootY]:
+                self.parent[rootX] = rootY
+            else:
+                self.parent[rootY] = rootX
+                self.rank[rootX] += 1
+            self.components -= 1
+            return True
+
+        def connected(self, x, y):
+            """Checks whether x and y are in the same set."""
+            return self.find(x) == self.find(y)
     
     
     # Heap
@@ -2,6 +2,11 @@
 
 import math
 
+try:
+    from utils.sorting_algorithms import SortingAlgorithms
+except ImportError:  # Run as a script, this file's own directory is on sys.path instead of src.
+    from sorting_algorithms import SortingAlgorithms
+
 class DivideAndConquerAlgorithms:
     """
     ### Divide and Conquer Algorithms:
@@ -63,14 +68,8 @@ class DivideAndConquerAlgorithms:
     # 3. Quick Sort
     @staticmethod
     def quick_sort(arr):
-        """Sorts an array using the quick sort algorithm."""
-        if len(arr) <= 1:
-            return arr
-        pivot = arr[len(arr) // 2]
-        left = [x for x in arr if x < pivot]
-        middle = [x for x in arr if x == pivot]
-        right = [x for x in arr if x > pivot]
-        return DivideAndConquerAlgorithms.quick_sort(left) + middle + DivideAndConquerAlgorithms.quick_sort(right)
+        """Sorts an array in place using the quick sort algorithm (in-place introsort)."""
+        return SortingAlgorithms.intro_sort(arr)
 
     # 4. Strassen's Matrix Multiplication
     @staticmethod
@@ -1,5 +1,21 @@
 #dynamic_programming.py
 
+import array
+import bisect
+import functools
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the "numpy" knapsack engine needs it.
+    np = None
+
+try:
+    from utils.math_algorithms import MathAlgorithms
+except ImportError:  # Run as a script, this file's own directory is on sys.path instead of src.
+    from math_algorithms import MathAlgorithms
+
 class DynamicProgramming:
     """
     ### Dynamic Programming (DP) Algorithms:
@@ -10,48 +26,286 @@ class DynamicProgramming:
     5. Longest Increasing Subsequence
     6. Edit Distance
     7. Matrix Chain Multiplication
+    8. Linear-Space LCS / Edit Distance (two-row, Hirschberg alignment, Myers/Hyyro bit-parallel)
+    9. Bounded Edit Distance (Ukkonen band, early abort)
+    10. Knapsack Variants (1-D rolling / NumPy, item reconstruction, bounded / unbounded multiplicity)
+    11. O(n log n) Longest Increasing Subsequence (patience sorting, sequence recovery, streaming)
+    12. Fast-Doubling Fibonacci and Linear Recurrences (matrix power, Kitamasa, modular, memoized)
     """
 
     @staticmethod
-    def fibonacci(n):
-        """Returns the nth Fibonacci number using dynamic programming."""
-        dp = [0] * (n + 1)
-        dp[1] = 1
-        for i in range(2, n + 1):
-            dp[i] = dp[i-1] + dp[i-2]
-        return dp[n]
+    @functools.lru_cache(maxsize=1024)
+    def fibonacci(n, mod=None):
+        """Returns the nth Fibonacci number (optionally modulo mod) by fast doubling in O(log n).
+
+        F(2k) = F(k) * (2F(k + 1) - F(k)) and F(2k + 1) = F(k)^2 + F(k + 1)^2, applied per bit of n.
+        """
+        if n < 0:
+            raise ValueError("fibonacci is defined for n >= 0")
+        a, b = 0, 1
+        for bit in bin(n)[2:]:
+            c = a * (2 * b - a)
+            d = a * a + b * b
+            if mod is not None:
+                c, d = c % mod, d % mod
+            a, b = (d, c + d) if bit == "1" else (c, d)
+            if mod is not None:
+                b %= mod
+        return a if mod is None else a % mod
 
     @staticmethod
-    def lcs(X, Y):
-        """Finds the Longest Common Subsequence (LCS) between two strings."""
-        m, n = len(X), len(Y)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
+    def linear_recurrence(coefficients, initial, n, mod=None, method="kitamasa"):
+        """Returns a(n) for a(i) = c1 * a(i-1) + ... + ck * a(i-k), given a(0..k-1) = initial.
 
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if X[i - 1] == Y[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                else:
-                    dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+        method is "kitamasa" (x^n reduced modulo the characteristic polynomial, O(k^2 log n)) or
+        "matrix" (companion matrix power, O(k^3 log n)). Both square through
+        MathAlgorithms.fast_exponentiation. Results are memoized in a bounded cache.
+        """
+        if len(coefficients) != len(initial):
+            raise ValueError("linear_recurrence needs one initial term per coefficient")
+        if method not in ("matrix", "kitamasa"):
+            raise ValueError(f"Unknown linear recurrence method: {method!r}")
+        return DynamicProgramming._linear_recurrence(tuple(coefficients), tuple(initial), n, mod, method)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _linear_recurrence(coefficients, initial, n, mod, method):
+        """Cached worker for linear_recurrence; arguments are tuples so they can be hashed."""
+        k = len(coefficients)
+        if n < 0:
+            raise ValueError("linear_recurrence is defined for n >= 0")
+        if n < k:
+            return initial[n] if mod is None else initial[n] % mod
 
-        return dp[m][n]
+        def reduce(x):
+            return x if mod is None else x % mod
+
+        if method == "matrix":
+            def multiply(A, B):
+                columns = list(zip(*B))
+                return [[reduce(sum(a * b for a, b in zip(row, column))) for column in columns] for row in A]
+
+            # The companion matrix maps (a(i-1), ..., a(i-k)) to (a(i), ..., a(i-k+1)).
+            companion = [list(coefficients)] + [[int(j == i) for j in range(k)] for i in range(k - 1)]
+            identity = [[int(i == j) for j in range(k)] for i in range(k)]
+            power = MathAlgorithms.fast_exponentiation(companion, n - k + 1, multiply, identity)
+            return reduce(sum(p * a for p, a in zip(power[0], reversed(initial))))
+
+        def multiply(p, q):
+            product = [0] * (2 * k - 1)
+            for i, a in enumerate(p):
+                if a:
+                    for j, b in enumerate(q):
+                        product[i + j] += a * b
+            # x^d = x^(d-k) * x^k = x^(d-k) * (c1 x^(k-1) + ... + ck), from the highest degree down.
+            for d in range(2 * k - 2, k - 1, -1):
+                t = reduce(product[d])
+                if t:
+                    for i, c in enumerate(coefficients, 1):
+                        product[d - i] += t * c
+            return [reduce(x) for x in product[:k]]
+
+        x = [0, 1] + [0] * (k - 2) if k > 1 else [coefficients[0]]
+        remainder = MathAlgorithms.fast_exponentiation(x, n, multiply, [1] + [0] * (k - 1))
+        return reduce(sum(r * a for r, a in zip(remainder, initial)))
 
     @staticmethod
-    def knapsack(weights, values, capacity):
-        """Solves the 0/1 Knapsack Problem."""
-        n = len(weights)
-        dp = [[0] * (capacity + 1) for _ in range(n + 1)]
+    def lcs(X, Y, engine="bit_parallel"):
+        """Finds the length of the Longest Common Subsequence (LCS) between two sequences.
 
-        for i in range(n + 1):
-            for w in range(capacity + 1):
-                if i == 0 or w == 0:
-                    dp[i][w] = 0
-                elif weights[i - 1] <= w:
-                    dp[i][w] = max(values[i - 1] + dp[i - 1][w - weights[i - 1]], dp[i - 1][w])
+        engine is "bit_parallel" (Hyyro's bit-vector recurrence on Python ints, roughly a machine
+        word of cells per operation) or "rolling" (two DP rows, O(min(m, n)) memory). The bit-parallel
+        engine keys its masks by element, so sequences of unhashable elements fall back to "rolling".
+        """
+        if engine == "bit_parallel":
+            try:
+                return DynamicProgramming._lcs_bit_parallel(X, Y)
+            except TypeError:  # unhashable elements
+                engine = "rolling"
+        if engine == "rolling":
+            if len(Y) > len(X):
+                X, Y = Y, X
+            return DynamicProgramming._lcs_row(X, Y)[-1]
+        raise ValueError(f"Unknown LCS engine: {engine!r}")
+
+    @staticmethod
+    def _lcs_row(X, Y):
+        """Returns the last row of the LCS table of X against Y, keeping only two rows."""
+        previous = [0] * (len(Y) + 1)
+        for x in X:
+            current = [0]
+            for j, y in enumerate(Y):
+                if x == y:
+                    current.append(previous[j] + 1)
                 else:
-                    dp[i][w] = dp[i - 1][w]
+                    current.append(max(previous[j + 1], current[j]))
+            previous = current
+        return previous
+
+    @staticmethod
+    def _bit_masks(seq):
+        """Maps each symbol of seq to an int with bit i set wherever seq[i] is that symbol."""
+        positions = {}
+        for i, symbol in enumerate(seq):
+            positions.setdefault(symbol, []).append(i)
+        masks = {}
+        for symbol, where in positions.items():
+            if len(where) <= 8:
+                mask = 0
+                for i in where:
+                    mask |= 1 << i
+            else:
+                # Setting bits one at a time would copy the growing int per position.
+                bits = bytearray((len(seq) + 7) // 8)
+                for i in where:
+                    bits[i >> 3] |= 1 << (i & 7)
+                mask = int.from_bytes(bits, "little")
+            masks[symbol] = mask
+        return masks
+
+    @staticmethod
+    def _lcs_bit_parallel(X, Y):
+        """Hyyro's bit-parallel LCS: the zero bits of V count the LCS after scanning X."""
+        if len(Y) < len(X):
+            X, Y = Y, X
+        if not X:
+            return 0
+        masks = DynamicProgramming._bit_masks(Y)
+        full = (1 << len(Y)) - 1
+        V = full
+        for x in X:
+            U = V & masks.get(x, 0)
+            V = ((V + U) | (V - U)) & full
+        return len(Y) - bin(V).count("1")
+
+    @staticmethod
+    def lcs_alignment(X, Y):
+        """Recovers an actual LCS in linear space with Hirschberg's divide and conquer.
+
+        Returns a string when both inputs are strings, otherwise a list.
+        """
+        result = []
+
+        def solve(X, Y):
+            if not X or not Y:
+                return
+            if len(X) == 1:
+                if X[0] in Y:
+                    result.append(X[0])
+                return
+            mid = len(X) // 2
+            left = DynamicProgramming._lcs_row(X[:mid], Y)
+            right = DynamicProgramming._lcs_row(X[:mid - 1:-1], Y[::-1])
+            n = len(Y)
+            split = max(range(n + 1), key=lambda k: left[k] + right[n - k])
+            solve(X[:mid], Y[:split])
+            solve(X[mid:], Y[split:])
+
+        solve(X, Y)
+        if isinstance(X, str) and isinstance(Y, str):
+            return "".join(result)
+        return result
+
+    @staticmethod
+    def knapsack(weights, values, capacity, engine="rolling", return_items=False):
+        """Solves the 0/1 Knapsack Problem.
+
+        engine is "rolling" (one capacity-sized row updated in reverse) or "numpy" (each item's row
+        update is a single vectorized maximum over shifted slices). With return_items=True, returns
+        (value, chosen item indices), recovered from a per-item bitset of take decisions.
+        """
+        if engine == "rolling":
+            best, decisions = DynamicProgramming._knapsack_rolling(weights, values, capacity, return_items)
+        elif engine == "numpy":
+            best, decisions = DynamicProgramming._knapsack_numpy(weights, values, capacity, return_items)
+        else:
+            raise ValueError(f"Unknown knapsack engine: {engine!r}")
+        if not return_items:
+            return best
+        items = []
+        c = capacity
+        for i in range(len(weights) - 1, -1, -1):
+            # decisions[i] has bit (c - weights[i]) set when item i was taken at capacity c.
+            offset = c - weights[i]
+            if offset >= 0 and decisions[i][offset >> 3] >> (offset & 7) & 1:
+                items.append(i)
+                c = offset
+        items.reverse()
+        return best, items
+
+    @staticmethod
+    def _knapsack_rolling(weights, values, capacity, record):
+        """Reverse-iterated 1-D knapsack DP; returns (best value, per-item decision bitsets or None)."""
+        dp = [0] * (capacity + 1)
+        decisions = [] if record else None
+        for weight, value in zip(weights, values):
+            taken = bytearray((capacity - weight + 8) // 8) if record and weight <= capacity else b""
+            for c in range(capacity, weight - 1, -1):
+                candidate = dp[c - weight] + value
+                if candidate > dp[c]:
+                    dp[c] = candidate
+                    if record:
+                        taken[(c - weight) >> 3] |= 1 << ((c - weight) & 7)
+            if record:
+                decisions.append(taken)
+        return dp[capacity], decisions
+
+    @staticmethod
+    def _knapsack_numpy(weights, values, capacity, record):
+        """Vectorized 1-D knapsack DP; returns (best value, per-item packed decision bitsets or None)."""
+        if np is None:
+            raise ImportError('knapsack(engine="numpy") requires NumPy.')
+        dtype = np.float64 if any(isinstance(v, float) for v in values) else np.int64
+        dp = np.zeros(capacity + 1, dtype=dtype)
+        decisions = [] if record else None
+        for weight, value in zip(weights, values):
+            taken = None
+            if weight <= capacity:
+                # The right-hand side is a fresh array, so every item is counted at most once.
+                candidate = dp[:capacity + 1 - weight] + value
+                if record:
+                    taken = candidate > dp[weight:]
+                np.maximum(dp[weight:], candidate, out=dp[weight:])
+            if record:
+                decisions.append(b"" if taken is None else np.packbits(taken, bitorder="little").tobytes())
+        return dp[capacity].item(), decisions
+
+    @staticmethod
+    def bounded_knapsack(weights, values, counts, capacity, engine="rolling", return_items=False):
+        """Solves the knapsack problem where item i may be taken up to counts[i] times (None = unbounded).
 
-        return dp[n][capacity]
+        Each item is binary-split into bundles of 1, 2, 4, ... copies plus a remainder, so any count
+        up to the limit is a 0/1 choice of bundles. With return_items=True, returns (value, copies per item).
+        Raises ValueError for an unbounded item with zero weight and positive value.
+        """
+        if counts is None:
+            counts = [None] * len(weights)
+        bundle_weights, bundle_values, owners = [], [], []
+        for i, (weight, value, count) in enumerate(zip(weights, values, counts)):
+            if count is None:
+                if weight <= 0:
+                    if value > 0:
+                        raise ValueError(f"Item {i} has no weight and positive value, so an unbounded count has no optimum.")
+                    count = 0
+                else:
+                    count = capacity // weight
+            size = 1
+            while count > 0:
+                take = min(size, count)
+                bundle_weights.append(weight * take)
+                bundle_values.append(value * take)
+                owners.append((i, take))
+                count -= take
+                size *= 2
+        result = DynamicProgramming.knapsack(bundle_weights, bundle_values, capacity, engine, return_items)
+        if not return_items:
+            return result
+        best, bundles = result
+        copies = [0] * len(weights)
+        for b in bundles:
+            i, take = owners[b]
+            copies[i] += take
+        return best, copies
 
     @staticmethod
     def coin_change(coins, amount):
@@ -66,36 +320,209 @@ class DynamicProgramming:
         return dp[amount] if dp[amount] != float('inf') else -1
 
     @staticmethod
-    def longest_increasing_subsequence(arr):
-        """Finds the length of the Longest Increasing Subsequence (LIS)."""
-        n = len(arr)
-        dp = [1] * n
+    def longest_increasing_subsequence(arr, strict=True, key=None, return_sequence=False):
+        """Finds the length of the Longest Increasing Subsequence (LIS) in O(n log n).
+
+        strict=False allows equal neighbours (longest non-decreasing subsequence). With
+        return_sequence=True, returns (length, one longest subsequence).
+        """
+        lis = DynamicProgramming.IncreasingSubsequence(strict, key, track_sequence=return_sequence).extend(arr)
+        if return_sequence:
+            return len(lis), lis.result()
+        return len(lis)
+
+    @staticmethod
+    def longest_increasing_subsequence_lengths(iterable, strict=True, key=None):
+        """Consumes an iterable lazily, yielding the current LIS length after each element."""
+        lis = DynamicProgramming.IncreasingSubsequence(strict, key, track_sequence=False)
+        for item in iterable:
+            yield lis.push(item)
+
+    class IncreasingSubsequence:
+        def __init__(self, strict=True, key=None, track_sequence=True):
+            """Streaming patience-sorting LIS: tails[l] is the smallest key ending an increasing run of length l + 1.
+
+            With track_sequence=False only the tails are kept (O(LIS) memory) and result() is unavailable.
+            """
+            self.key = key
+            self.search = bisect.bisect_left if strict else bisect.bisect_right
+            self.tails = []
+            self.items = [] if track_sequence else None
+            self.tail_index = array.array('l') if track_sequence else None
+            self.predecessor = array.array('l') if track_sequence else None
+
+        def __len__(self):
+            return len(self.tails)
+
+        def push(self, item):
+            """Offers one item; returns the current LIS length."""
+            self.extend((item,))
+            return len(self.tails)
+
+        def extend(self, iterable):
+            """Offers every item of an iterable, consuming it lazily."""
+            key, search = self.key, self.search
+            items, tails, tail_index, predecessor = self.items, self.tails, self.tail_index, self.predecessor
+            if items is None:
+                for item in iterable:
+                    k = key(item) if key else item
+                    length = search(tails, k)
+                    if length == len(tails):
+                        tails.append(k)
+                    else:
+                        tails[length] = k
+                return self
+            for item in iterable:
+                k = key(item) if key else item
+                length = search(tails, k)
+                predecessor.append(tail_index[length - 1] if length else -1)
+                if length == len(tails):
+                    tails.append(k)
+                    tail_index.append(len(items))
+                else:
+                    tails[length] = k
+                    tail_index[length] = len(items)
+                items.append(item)
+            return self
+
+        def result(self):
+            """Returns one longest increasing subsequence seen so far."""
+            if self.items is None:
+                raise ValueError("result() needs an IncreasingSubsequence created with track_sequence=True")
+            sequence = []
+            i = self.tail_index[-1] if self.tails else -1
+            while i != -1:
+                sequence.append(self.items[i])
+                i = self.predecessor[i]
+            sequence.reverse()
+            return sequence
+
+    @staticmethod
+    def edit_distance(str1, str2, engine="bit_parallel"):
+        """Finds the Edit Distance (Levenshtein Distance) between two strings.
 
-        for i in range(1, n):
-            for j in range(i):
-                if arr[i] > arr[j]:
-                    dp[i] = max(dp[i], dp[j] + 1)
+        engine is "bit_parallel" (Myers/Hyyro bit-vector algorithm on Python ints) or "rolling"
+        (two DP rows, O(min(m, n)) memory). Sequences of unhashable elements fall back to "rolling".
+        """
+        if engine == "bit_parallel":
+            try:
+                return DynamicProgramming._edit_distance_bit_parallel(str1, str2)
+            except TypeError:  # unhashable elements
+                engine = "rolling"
+        if engine == "rolling":
+            if len(str2) > len(str1):
+                str1, str2 = str2, str1
+            return DynamicProgramming._edit_distance_row(str1, str2)[-1]
+        raise ValueError(f"Unknown edit distance engine: {engine!r}")
 
-        return max(dp)
+    @staticmethod
+    def _edit_distance_row(str1, str2):
+        """Returns the last row of the edit distance table of str1 against str2, keeping only two rows."""
+        previous = list(range(len(str2) + 1))
+        for i, a in enumerate(str1, 1):
+            current = [i]
+            for j, b in enumerate(str2):
+                if a == b:
+                    current.append(previous[j])
+                else:
+                    current.append(1 + min(previous[j], previous[j + 1], current[j]))
+            previous = current
+        return previous
 
     @staticmethod
-    def edit_distance(str1, str2):
-        """Finds the Edit Distance (Levenshtein Distance) between two strings."""
+    def _edit_distance_bit_parallel(str1, str2):
+        """Myers' bit-vector edit distance (Hyyro's global formulation), one column per scanned symbol.
+
+        Pv/Mv hold the +1/-1 vertical deltas of the current column; score tracks its last cell.
+        """
+        if len(str2) < len(str1):
+            str1, str2 = str2, str1
+        if not str1:
+            return len(str2)
+        masks = DynamicProgramming._bit_masks(str2)
+        m = len(str2)
+        full = (1 << m) - 1
+        high = 1 << (m - 1)
+        Pv, Mv, score = full, 0, m
+        for a in str1:
+            Eq = masks.get(a, 0)
+            Xv = Eq | Mv
+            Xh = (((Eq & Pv) + Pv) ^ Pv) | Eq
+            Ph = Mv | (~(Xh | Pv) & full)
+            Mh = Pv & Xh
+            if Ph & high:
+                score += 1
+            elif Mh & high:
+                score -= 1
+            Ph = ((Ph << 1) | 1) & full
+            Mh = (Mh << 1) & full
+            Pv = Mh | (~(Xv | Ph) & full)
+            Mv = Ph & Xv
+        return score
+
+    @staticmethod
+    def bounded_edit_distance(str1, str2, k):
+        """Returns the edit distance if it is at most k, otherwise None.
+
+        Only the 2k + 1 diagonals around the main one are filled (Ukkonen's band), and the scan stops
+        as soon as every cell of a row exceeds k.
+        """
         m, n = len(str1), len(str2)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-        for i in range(m + 1):
-            for j in range(n + 1):
-                if i == 0:
-                    dp[i][j] = j
-                elif j == 0:
-                    dp[i][j] = i
-                elif str1[i - 1] == str2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1]
+        if abs(m - n) > k:
+            return None
+        limit = k + 1
+        # band[d + 1] holds the cell on diagonal d = j - i + k; the two ends are permanent sentinels.
+        previous = [limit] * (2 * k + 3)
+        for j in range(min(n, k) + 1):
+            previous[j + k + 1] = j
+        for i in range(1, m + 1):
+            current = [limit] * (2 * k + 3)
+            if i <= k:
+                current[k - i + 1] = i
+            a = str1[i - 1]
+            for j in range(max(1, i - k), min(n, i + k) + 1):
+                d = j - i + k + 1
+                if a == str2[j - 1]:
+                    current[d] = previous[d]
                 else:
-                    dp[i][j] = 1 + min(dp[i - 1][j - 1], dp[i - 1][j], dp[i][j - 1])
+                    current[d] = min(limit, 1 + min(previous[d], previous[d + 1], current[d - 1]))
+            if min(current) > k:
+                return None
+            previous = current
+        distance = previous[n - m + k + 1]
+        return distance if distance <= k else None
+
+    @staticmethod
+    def edit_script(str1, str2):
+        """Recovers a minimal edit script in linear space with Hirschberg's divide and conquer.
+
+        Returns a list of (operation, a, b) steps turning str1 into str2, where operation is
+        "match", "substitute", "delete" (b is None) or "insert" (a is None).
+        """
+        script = []
 
-        return dp[m][n]
+        def solve(str1, str2):
+            if not str1:
+                script.extend(("insert", None, b) for b in str2)
+            elif not str2:
+                script.extend(("delete", a, None) for a in str1)
+            elif len(str1) == 1:
+                a = str1[0]
+                j = str2.index(a) if a in str2 else 0
+                script.extend(("insert", None, b) for b in str2[:j])
+                script.append(("match" if a == str2[j] else "substitute", a, str2[j]))
+                script.extend(("insert", None, b) for b in str2[j + 1:])
+            else:
+                mid = len(str1) // 2
+                left = DynamicProgramming._edit_distance_row(str1[:mid], str2)
+                right = DynamicProgramming._edit_distance_row(str1[:mid - 1:-1], str2[::-1])
+                n = len(str2)
+                split = min(range(n + 1), key=lambda k: left[k] + right[n - k])
+                solve(str1[:mid], str2[:split])
+                solve(str1[mid:], str2[split:])
+
+        solve(str1, str2)
+        return script
 
     @staticmethod
     def matrix_chain_multiplication(dimensions):
@@ -113,22 +540,86 @@ class DynamicProgramming:
 
         return dp[0][n - 1]
     
+    @staticmethod
+    def benchmark(lengths=(200, 800, 3200), items=200, capacity=20000, series=1000000):
+        """Times the LCS / edit distance engines across string lengths, the knapsack engines and LIS."""
+        def timed(fn):
+            start = time.perf_counter()
+            fn()
+            return time.perf_counter() - start
+
+        print("LCS / edit distance benchmark (random DNA strings):")
+        for n in lengths:
+            a = "".join(random.choice("ACGT") for _ in range(n))
+            b = "".join(random.choice("ACGT") for _ in range(n))
+            rolling = timed(lambda: DynamicProgramming.lcs(a, b, engine="rolling"))
+            bits = timed(lambda: DynamicProgramming.lcs(a, b))
+            alignment = timed(lambda: DynamicProgramming.lcs_alignment(a, b))
+            print(f"  n={n:<6} lcs rolling: {rolling:.4f}s  bit-parallel: {bits:.4f}s  "
+                  f"speedup: {rolling / bits:.1f}x  hirschberg: {alignment:.4f}s")
+            rolling = timed(lambda: DynamicProgramming.edit_distance(a, b, engine="rolling"))
+            bits = timed(lambda: DynamicProgramming.edit_distance(a, b))
+            script = timed(lambda: DynamicProgramming.edit_script(a, b))
+            print(f"  n={n:<6} edit rolling: {rolling:.4f}s  bit-parallel: {bits:.4f}s  "
+                  f"speedup: {rolling / bits:.1f}x  hirschberg: {script:.4f}s")
+            near = list(a)
+            for _ in range(4):
+                near[random.randrange(n)] = random.choice("ACGT")
+            near = "".join(near)
+            bounded = timed(lambda: DynamicProgramming.bounded_edit_distance(a, near, 8))
+            rejected = timed(lambda: DynamicProgramming.bounded_edit_distance(a, b, 8))
+            print(f"  n={n:<6} bounded k=8: near-duplicate {bounded:.4f}s  unrelated (early abort) {rejected:.4f}s")
+
+        weights = [random.randint(1, capacity // 10) for _ in range(items)]
+        values = [random.randint(1, 1000) for _ in range(items)]
+        print(f"Knapsack benchmark ({items} items, capacity {capacity}):")
+        rolling = timed(lambda: DynamicProgramming.knapsack(weights, values, capacity, return_items=True))
+        print(f"  rolling with items: {rolling:.4f}s")
+        if np is not None:
+            vectorized = timed(lambda: DynamicProgramming.knapsack(weights, values, capacity, "numpy", True))
+            print(f"  numpy with items:   {vectorized:.4f}s  speedup: {rolling / vectorized:.1f}x")
+
+        prices = [random.random() for _ in range(series)]
+        elapsed = timed(lambda: DynamicProgramming.longest_increasing_subsequence(prices, return_sequence=True))
+        print(f"LIS benchmark (n={series}): {elapsed:.4f}s")
+
+        print("Linear recurrence benchmark (order k, n = 10^18, mod 10^9+7):")
+        for k in (4, 16, 48):
+            coefficients = [random.randint(0, 9) for _ in range(k)]
+            initial = [random.randint(0, 9) for _ in range(k)]
+            matrix = timed(lambda: DynamicProgramming.linear_recurrence(coefficients, initial, 10**18, 10**9 + 7, "matrix"))
+            kitamasa = timed(lambda: DynamicProgramming.linear_recurrence(coefficients, initial, 10**18, 10**9 + 7, "kitamasa"))
+            print(f"  k={k:<3} matrix: {matrix:.4f}s  kitamasa: {kitamasa:.4f}s  speedup: {matrix / kitamasa:.1f}x")
+        elapsed = timed(lambda: DynamicProgramming.fibonacci(10**6))
+        print(f"Fast-doubling Fibonacci (n=10^6, exact): {elapsed:.4f}s")
+
     @staticmethod
     def main():
         # Test Fibonacci Sequence
         n = 10
         print(f"Fibonacci of {n}:", DynamicProgramming.fibonacci(n))
+        print(f"Fibonacci of 0:", DynamicProgramming.fibonacci(0))
+        print(f"Fibonacci of 10^18 mod 10^9+7:", DynamicProgramming.fibonacci(10**18, 10**9 + 7))
+        print(f"Tribonacci of {n} (matrix):", DynamicProgramming.linear_recurrence([1, 1, 1], [0, 0, 1], n, method="matrix"))
+        print(f"Tribonacci of {n} (Kitamasa):", DynamicProgramming.linear_recurrence([1, 1, 1], [0, 0, 1], n, method="kitamasa"))
 
         # Test Longest Common Subsequence (LCS)
         X = "AGGTAB"
         Y = "GXTXAYB"
         print(f"LCS of {X} and {Y}:", DynamicProgramming.lcs(X, Y))
+        print(f"LCS of {X} and {Y} (rolling rows):", DynamicProgramming.lcs(X, Y, engine="rolling"))
+        print(f"LCS alignment of {X} and {Y}:", DynamicProgramming.lcs_alignment(X, Y))
 
         # Test Knapsack Problem
         weights = [1, 2, 3]
         values = [60, 100, 120]
         capacity = 5
         print(f"Knapsack Result:", DynamicProgramming.knapsack(weights, values, capacity))
+        print(f"Knapsack Result with items:", DynamicProgramming.knapsack(weights, values, capacity, return_items=True))
+        if np is not None:
+            print(f"Knapsack Result (numpy):", DynamicProgramming.knapsack(weights, values, capacity, engine="numpy", return_items=True))
+        print(f"Bounded Knapsack Result (counts 2, 1, 1):", DynamicProgramming.bounded_knapsack(weights, values, [2, 1, 1], capacity, return_items=True))
+        print(f"Unbounded Knapsack Result:", DynamicProgramming.bounded_knapsack(weights, values, None, capacity, return_items=True))
 
         # Test Coin Change Problem
         coins = [1, 2, 5]
@@ -138,11 +629,19 @@ class DynamicProgramming:
         # Test Longest Increasing Subsequence (LIS)
         arr = [10, 22, 9, 33, 21, 50, 41, 60, 80]
         print(f"Longest Increasing Subsequence Length:", DynamicProgramming.longest_increasing_subsequence(arr))
+        print(f"Longest Increasing Subsequence:", DynamicProgramming.longest_increasing_subsequence(arr, return_sequence=True))
+        print(f"Longest Non-Decreasing Subsequence of [3, 3, 1, 3]:", DynamicProgramming.longest_increasing_subsequence([3, 3, 1, 3], strict=False, return_sequence=True))
+        print(f"Longest Increasing Subsequence Lengths (streaming):", list(DynamicProgramming.longest_increasing_subsequence_lengths(iter(arr))))
+        print(f"Longest Increasing Subsequence Length of []:", DynamicProgramming.longest_increasing_subsequence([]))
 
         # Test Edit Distance
         str1 = "sitting"
         str2 = "kitten"
         print(f"Edit Distance between {str1} and {str2}:", DynamicProgramming.edit_distance(str1, str2))
+        print(f"Edit Distance between {str1} and {str2} (rolling rows):", DynamicProgramming.edit_distance(str1, str2, engine="rolling"))
+        print(f"Edit script from {str1} to {str2}:", DynamicProgramming.edit_script(str1, str2))
+        print(f"Bounded Edit Distance (k=3) between {str1} and {str2}:", DynamicProgramming.bounded_edit_distance(str1, str2, 3))
+        print(f"Bounded Edit Distance (k=2) between {str1} and {str2}:", DynamicProgramming.bounded_edit_distance(str1, str2, 2))
 
         # Test Matrix Chain Multiplication
         dimensions = [1, 2, 3, 4]
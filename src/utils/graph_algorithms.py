@@ -1,8 +1,26 @@
 # graphing_algorithms.py
 
+import array
 import heapq
+import math
+import multiprocessing
+import multiprocessing.pool
+import os
+import pickle
+import random
+import time
 from collections import defaultdict, deque
 
+try:
+    from utils.data_structures import DataStructures
+except ImportError:  # Run as a script, this file's own directory is on sys.path instead of src.
+    from data_structures import DataStructures
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only floyd_warshall_numpy needs it.
+    np = None
+
 class GraphAlgorithms:
     """
     ### Graph Algorithms:
@@ -14,11 +32,154 @@ class GraphAlgorithms:
     6. Prim's Algorithm
     7. Topological Sort
     8. Tarjan's Algorithm
+    9. Compressed Sparse Row (CSR) Graph
+    10. Point-to-Point Dijkstra (binary heap, Dial's buckets, radix heap)
+    11. Johnson's Algorithm (streaming, parallel all-pairs shortest paths)
+    12. Vectorized / Blocked Floyd-Warshall (NumPy)
+    13. Shortest Path Faster Algorithm (queue-based Bellman-Ford)
+    14. A* Search (callable heuristics, occupancy grids, bidirectional)
+    15. Contraction Hierarchies
+    16. Strongly Connected Components (iterative Tarjan / Kosaraju, condensation DAG)
+    17. Cycle Detection, Level-Scheduled and Online (Pearce-Kelly) Topological Order
+    18. Streaming Kruskal and Parallel Boruvka (array-backed Union-Find)
+
+    dijkstra, bellman_ford, kruskal, prim, topological_sort and tarjan also accept a CSRGraph and
+    then work in node-id space: start nodes are ids, and results are arrays indexed by id or lists of ids.
     """
 
+    class CSRGraph:
+        def __init__(self, offsets, targets, weights, labels):
+            """Compressed sparse row graph: the out-edges of node u are targets/weights[offsets[u]:offsets[u + 1]]."""
+            self.offsets = offsets
+            self.targets = targets
+            self.weights = weights
+            self.labels = labels
+            self.index = {label: i for i, label in enumerate(labels)}
+            self.num_nodes = len(labels)
+            self._max_weight = None
+
+        @staticmethod
+        def from_edges(edges, nodes=(), directed=True):
+            """Builds a CSRGraph from (u, v) or (u, v, weight) edges with arbitrary hashable labels.
+
+            Labels are interned to ids in order of first appearance (nodes first, then edges).
+            Undirected graphs store each edge in both directions.
+            """
+            index = {}
+            labels = []
+
+            def intern(label):
+                i = index.get(label)
+                if i is None:
+                    i = index[label] = len(labels)
+                    labels.append(label)
+                return i
+
+            for node in nodes:
+                intern(node)
+            sources, destinations = array.array('l'), array.array('l')
+            edge_weights = array.array('d')
+            integral = True
+            for edge in edges:
+                u, v = intern(edge[0]), intern(edge[1])
+                w = edge[2] if len(edge) > 2 else 1
+                integral = integral and isinstance(w, int)
+                sources.append(u)
+                destinations.append(v)
+                edge_weights.append(w)
+                if not directed:
+                    sources.append(v)
+                    destinations.append(u)
+                    edge_weights.append(w)
+
+            # Counting sort of the edges by source node gives the row layout.
+            n, m = len(labels), len(sources)
+            offsets = array.array('q', [0]) * (n + 1)
+            for u in sources:
+                offsets[u + 1] += 1
+            for u in range(n):
+                offsets[u + 1] += offsets[u]
+            fill = offsets[:-1]
+            targets = array.array('l', [0]) * m
+            weights = array.array('q' if integral else 'd', [0]) * m
+            for e in range(m):
+                u = sources[e]
+                slot = fill[u]
+                targets[slot] = destinations[e]
+                weights[slot] = int(edge_weights[e]) if integral else edge_weights[e]
+                fill[u] = slot + 1
+            return GraphAlgorithms.CSRGraph(offsets, targets, weights, labels)
+
+        @staticmethod
+        def from_dict(graph, weighted=True):
+            """Builds a CSRGraph from the dict format used by GraphAlgorithms.
+
+            Weighted graphs map node -> [(neighbor, weight), ...]; unweighted ones map
+            node -> [neighbor, ...] and get weight 1 on every edge.
+            """
+            if weighted:
+                edges = ((u, v, w) for u in graph for v, w in graph[u])
+            else:
+                edges = ((u, v) for u in graph for v in graph[u])
+            return GraphAlgorithms.CSRGraph.from_edges(edges, nodes=graph)
+
+        def __len__(self):
+            return self.num_nodes
+
+        @property
+        def num_edges(self):
+            return len(self.targets)
+
+        @property
+        def max_weight(self):
+            """Largest edge weight (0 without edges), computed on first use and cached."""
+            if self._max_weight is None:
+                self._max_weight = max(self.weights, default=0)
+            return self._max_weight
+
+        def neighbors(self, u):
+            """Returns the out-neighbor ids of node u."""
+            return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+        def edges(self, u):
+            """Returns (neighbor, weight) pairs for the out-edges of node u."""
+            start, end = self.offsets[u], self.offsets[u + 1]
+            return zip(self.targets[start:end], self.weights[start:end])
+
+        def sources(self):
+            """Returns an array holding the source id of every edge, parallel to targets."""
+            sources = array.array('l', [0]) * len(self.targets)
+            offsets = self.offsets
+            for u in range(self.num_nodes):
+                for e in range(offsets[u], offsets[u + 1]):
+                    sources[e] = u
+            return sources
+
+        def reverse(self):
+            """Returns the transpose graph (every edge u -> v becomes v -> u) with the same ids."""
+            n, m = self.num_nodes, len(self.targets)
+            offsets = array.array('q', [0]) * (n + 1)
+            for v in self.targets:
+                offsets[v + 1] += 1
+            for v in range(n):
+                offsets[v + 1] += offsets[v]
+            fill = offsets[:-1]
+            targets = array.array('l', [0]) * m
+            weights = array.array(self.weights.typecode, [0]) * m
+            for u in range(n):
+                for e in range(self.offsets[u], self.offsets[u + 1]):
+                    v = self.targets[e]
+                    slot = fill[v]
+                    targets[slot] = u
+                    weights[slot] = self.weights[e]
+                    fill[v] = slot + 1
+            return GraphAlgorithms.CSRGraph(offsets, targets, weights, self.labels)
+
     @staticmethod
     def dijkstra(graph, start):
         """Performs Dijkstra's Algorithm to find the shortest paths from the start node."""
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            return GraphAlgorithms._dijkstra_csr(graph, start)
         distances = {node: float('inf') for node in graph}
         distances[start] = 0
         priority_queue = [(0, start)]
@@ -38,6 +199,8 @@ class GraphAlgorithms:
     @staticmethod
     def bellman_ford(graph, start):
         """Performs Bellman-Ford Algorithm to find the shortest paths from the start node."""
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            return GraphAlgorithms._bellman_ford_csr(graph, start)
         distances = {node: float('inf') for node in graph}
         distances[start] = 0
         for _ in range(len(graph) - 1):
@@ -101,47 +264,125 @@ class GraphAlgorithms:
     @staticmethod
     def kruskal(graph):
         """Performs Kruskal's Algorithm to find the Minimum Spanning Tree."""
-        edges = []
-        for node in graph:
-            for neighbor, weight in graph[node]:
-                edges.append((weight, node, neighbor))
-        edges.sort()  # Sort edges by weight
-
-        parent = {}
-        rank = {}
-
-        def find(x):
-            if parent[x] != x:
-                parent[x] = find(parent[x])
-            return parent[x]
-
-        def union(x, y):
-            rootX = find(x)
-            rootY = find(y)
-            if rootX != rootY:
-                if rank[rootX] > rank[rootY]:
-                    parent[rootY] = rootX
-                elif rank[rootX] < rank[rootY]:
-                    parent[rootX] = rootY
-                else:
-                    parent[rootY] = rootX
-                    rank[rootX] += 1
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            return GraphAlgorithms._kruskal_csr(graph)
+        csr = GraphAlgorithms.CSRGraph.from_dict(graph)
+        return [(csr.labels[u], csr.labels[v], w) for u, v, w in GraphAlgorithms._kruskal_csr(csr)]
 
-        for node in graph:
-            parent[node] = node
-            rank[node] = 0
+    @staticmethod
+    def kruskal_stream(edges, num_nodes):
+        """Kruskal over (u, v, weight) edges already sorted by weight, with node ids in range(num_nodes).
 
+        edges may be any iterable or the path of a text file with one "u v weight" edge per line
+        (e.g. produced by an external sort). Consumption stops after num_nodes - 1 MST edges.
+        """
+        if isinstance(edges, (str, os.PathLike)):
+            edges = GraphAlgorithms._read_edge_file(edges)
+        components = DataStructures.UnionFind(num_nodes)
         mst = []
-        for weight, u, v in edges:
-            if find(u) != find(v):
-                union(u, v)
+        previous = None
+        for u, v, weight in edges:
+            if previous is not None and weight < previous:
+                raise ValueError("kruskal_stream needs edges sorted by weight")
+            previous = weight
+            if components.union(u, v):
                 mst.append((u, v, weight))
-
+                if len(mst) == num_nodes - 1:
+                    break
         return mst
 
+    @staticmethod
+    def _read_edge_file(path):
+        """Yields (u, v, weight) from a text file of "u v weight" lines; blank and # lines are skipped."""
+        with open(path) as f:
+            for line in f:
+                fields = line.split()
+                if not fields or fields[0].startswith('#'):
+                    continue
+                try:
+                    weight = int(fields[2])
+                except ValueError:
+                    weight = float(fields[2])
+                yield int(fields[0]), int(fields[1]), weight
+
+    @staticmethod
+    def _boruvka_init(graph):
+        """Pool initializer: keeps the CSR graph in each worker process."""
+        GraphAlgorithms._boruvka_state = graph
+
+    @staticmethod
+    def _boruvka_scan(task, graph=None):
+        """Finds the cheapest outgoing edge of every component touched by the nodes in [lo, hi).
+
+        Edges are ranked by (weight, min endpoint, max endpoint) so ties break the same way in every
+        worker, which keeps the merged choices acyclic.
+        """
+        lo, hi, component = task
+        graph = graph or GraphAlgorithms._boruvka_state
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        cheapest = {}
+        for u in range(lo, hi):
+            cu = component[u]
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                cv = component[v]
+                if cu != cv:
+                    edge = (weights[e], u, v) if u < v else (weights[e], v, u)
+                    if cu not in cheapest or edge < cheapest[cu]:
+                        cheapest[cu] = edge
+                    if cv not in cheapest or edge < cheapest[cv]:
+                        cheapest[cv] = edge
+        return cheapest
+
+    @staticmethod
+    def boruvka(graph, workers=1):
+        """Performs Boruvka's Algorithm, scanning for each component's cheapest edge on a process pool.
+
+        Every round splits the node range into one chunk per worker and merges the per-chunk minima,
+        so the number of components at least halves per round. Returns a minimum spanning forest as
+        (u, v, weight) triples (ids for a CSRGraph, labels for dict graphs).
+        """
+        csr = graph
+        if not isinstance(graph, GraphAlgorithms.CSRGraph):
+            csr = GraphAlgorithms.CSRGraph.from_dict(graph)
+        n = csr.num_nodes
+        components = DataStructures.UnionFind(n)
+        chunk = -(-n // workers) if n else 1
+        pool = None
+        if workers > 1:
+            pool = multiprocessing.Pool(workers, initializer=GraphAlgorithms._boruvka_init, initargs=(csr,))
+        mst = []
+        try:
+            while components.components > 1:
+                component = array.array('l', map(components.find, range(n)))
+                tasks = [(lo, min(lo + chunk, n), component) for lo in range(0, n, chunk)]
+                if pool is None:
+                    partial = [GraphAlgorithms._boruvka_scan(task, csr) for task in tasks]
+                else:
+                    partial = pool.map(GraphAlgorithms._boruvka_scan, tasks)
+                cheapest = {}
+                for found in partial:
+                    for c, edge in found.items():
+                        if c not in cheapest or edge < cheapest[c]:
+                            cheapest[c] = edge
+                if not cheapest:
+                    break  # The remaining components are disconnected.
+                for weight, u, v in sorted(set(cheapest.values())):
+                    if components.union(u, v):
+                        mst.append((u, v, weight))
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        if csr is graph:
+            return mst
+        return [(csr.labels[u], csr.labels[v], w) for u, v, w in mst]
+
     @staticmethod
     def prim(graph, start):
         """Performs Prim's Algorithm to find the Minimum Spanning Tree."""
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            return GraphAlgorithms._prim_csr(graph, start)
         mst = []
         visited = set([start])
         edges = [(weight, start, neighbor) for neighbor, weight in graph[start]]
@@ -161,6 +402,8 @@ class GraphAlgorithms:
     @staticmethod
     def topological_sort(graph):
         """Performs Topological Sort on a Directed Acyclic Graph (DAG)."""
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            return GraphAlgorithms._topological_sort_csr(graph)
         in_degree = {node: 0 for node in graph}
         for node in graph:
             for neighbor in graph[node]:
@@ -177,47 +420,1061 @@ class GraphAlgorithms:
                 if in_degree[neighbor] == 0:
                     queue.append(neighbor)
 
+        if len(sorted_list) < len(graph):
+            raise ValueError(f"Graph contains a cycle: {GraphAlgorithms.find_cycle(graph)}")
         return sorted_list
 
+    @staticmethod
+    def find_cycle(graph):
+        """Returns a directed cycle as a node list (the last node links back to the first), or None."""
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            return GraphAlgorithms._find_cycle_csr(graph)
+        csr = GraphAlgorithms.CSRGraph.from_dict(graph, weighted=False)
+        cycle = GraphAlgorithms._find_cycle_csr(csr)
+        return None if cycle is None else [csr.labels[v] for v in cycle]
+
+    @staticmethod
+    def topological_levels(graph):
+        """Groups a DAG into wavefronts: every node's predecessors all lie in earlier levels.
+
+        Nodes within a level are independent, so each level can run concurrently.
+        Raises ValueError with the offending cycle if the graph is not a DAG.
+        """
+        csr = graph
+        if not isinstance(graph, GraphAlgorithms.CSRGraph):
+            csr = GraphAlgorithms.CSRGraph.from_dict(graph, weighted=False)
+        offsets, targets = csr.offsets, csr.targets
+        in_degree = array.array('l', [0]) * csr.num_nodes
+        for v in targets:
+            in_degree[v] += 1
+        level = [u for u in range(csr.num_nodes) if in_degree[u] == 0]
+        levels, placed = [], 0
+        while level:
+            levels.append(level)
+            placed += len(level)
+            next_level = []
+            for u in level:
+                for e in range(offsets[u], offsets[u + 1]):
+                    v = targets[e]
+                    in_degree[v] -= 1
+                    if in_degree[v] == 0:
+                        next_level.append(v)
+            level = next_level
+        if placed < csr.num_nodes:
+            raise ValueError(f"Graph contains a cycle: {GraphAlgorithms.find_cycle(graph)}")
+        if csr is graph:
+            return levels
+        return [[csr.labels[u] for u in level] for level in levels]
+
+    @staticmethod
+    def run_topological_levels(graph, task, workers=None, threads=False):
+        """Runs task(node) for every node of a DAG on a process (or thread) pool, one level at a time.
+
+        Returns a node -> result dict. Process pools need a picklable, module-level task.
+        """
+        pool_type = multiprocessing.pool.ThreadPool if threads else multiprocessing.Pool
+        results = {}
+        with pool_type(workers) as pool:
+            for level in GraphAlgorithms.topological_levels(graph):
+                results.update(zip(level, pool.map(task, level)))
+        return results
+
+    class OnlineTopologicalOrder:
+        def __init__(self, nodes=(), edges=()):
+            """Topological order maintained incrementally under edge insertions (Pearce-Kelly).
+
+            Inserting u -> v only reorders the nodes whose positions lie between v and u.
+            """
+            self.position = {}
+            self.nodes = []
+            self.successors = {}
+            self.predecessors = {}
+            for node in nodes:
+                self.add_node(node)
+            for u, v in edges:
+                self.add_edge(u, v)
+
+        def __len__(self):
+            return len(self.nodes)
+
+        def add_node(self, node):
+            """Appends node to the order if it is new."""
+            if node not in self.position:
+                self.position[node] = len(self.nodes)
+                self.nodes.append(node)
+                self.successors[node] = set()
+                self.predecessors[node] = set()
+
+        def add_edge(self, u, v):
+            """Adds u -> v and restores the order; raises ValueError with the cycle if u -> v would close one."""
+            self.add_node(u)
+            self.add_node(v)
+            if v in self.successors[u]:
+                return
+            position = self.position
+            lower, upper = position[v], position[u]
+            if lower == upper:
+                raise ValueError(f"Edge {u!r} -> {v!r} creates a cycle: {[u]}")
+            if lower < upper:
+                # Forward search from v within the affected region; reaching u means a cycle.
+                forward = {v: None}
+                stack = [v]
+                while stack:
+                    x = stack.pop()
+                    for y in self.successors[x]:
+                        if y == u:
+                            cycle = [x]
+                            while forward[cycle[-1]] is not None:
+                                cycle.append(forward[cycle[-1]])
+                            cycle.reverse()
+                            raise ValueError(f"Edge {u!r} -> {v!r} creates a cycle: {[u] + cycle}")
+                        if y not in forward and position[y] < upper:
+                            forward[y] = x
+                            stack.append(y)
+                backward = {u}
+                stack = [u]
+                while stack:
+                    x = stack.pop()
+                    for y in self.predecessors[x]:
+                        if y not in backward and position[y] > lower:
+                            backward.add(y)
+                            stack.append(y)
+                # Reuse the affected slots: everything reaching u first, then everything reachable from v.
+                moved = sorted(backward, key=position.__getitem__) + sorted(forward, key=position.__getitem__)
+                slots = sorted(position[x] for x in moved)
+                for x, slot in zip(moved, slots):
+                    position[x] = slot
+                    self.nodes[slot] = x
+            self.successors[u].add(v)
+            self.predecessors[v].add(u)
+
+        def order(self):
+            """Returns the current topological order."""
+            return list(self.nodes)
+
     @staticmethod
     def tarjan(graph):
         """Performs Tarjan's Algorithm to find Strongly Connected Components (SCCs)."""
-        index = 0
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            return GraphAlgorithms._tarjan_csr(graph)
+        csr = GraphAlgorithms.CSRGraph.from_dict(graph, weighted=False)
+        return [[csr.labels[v] for v in scc] for scc in GraphAlgorithms._tarjan_csr(csr)]
+
+    @staticmethod
+    def strongly_connected_components(graph, algorithm="tarjan", condensation=False):
+        """Labels every node with the id of its SCC, using explicit stacks so long chains cannot overflow.
+
+        algorithm is "tarjan" (one pass) or "kosaraju" (two passes over the graph and its transpose).
+        Component ids follow a topological order of the condensation: edges between components only
+        go from lower to higher ids. Returns an array('l') of component ids indexed by node id for a
+        CSRGraph, or a node -> id dict for dict graphs; with condensation=True, returns (component, dag)
+        where dag is a CSRGraph over component ids without duplicate edges.
+        """
+        csr = graph
+        if not isinstance(graph, GraphAlgorithms.CSRGraph):
+            csr = GraphAlgorithms.CSRGraph.from_dict(graph, weighted=False)
+        if algorithm == "tarjan":
+            count, component = GraphAlgorithms._tarjan_components(csr)
+        elif algorithm == "kosaraju":
+            count, component = GraphAlgorithms._kosaraju_components(csr)
+        else:
+            raise ValueError(f"Unknown SCC algorithm: {algorithm!r}")
+        result = component if csr is graph else {label: component[v] for v, label in enumerate(csr.labels)}
+        if not condensation:
+            return result
+        sources, targets = csr.sources(), csr.targets
+        seen = set()
+        edges = []
+        for e in range(len(targets)):
+            a, b = component[sources[e]], component[targets[e]]
+            if a != b and a * count + b not in seen:
+                seen.add(a * count + b)
+                edges.append((a, b))
+        return result, GraphAlgorithms.CSRGraph.from_edges(edges, nodes=range(count))
+
+    class BinaryHeapQueue:
+        def __init__(self):
+            """Binary-heap priority queue of (key, item) pairs."""
+            self.heap = []
+
+        def __len__(self):
+            return len(self.heap)
+
+        def push(self, key, item):
+            heapq.heappush(self.heap, (key, item))
+
+        def pop(self):
+            return heapq.heappop(self.heap)
+
+    class DialBucketQueue:
+        def __init__(self, max_weight):
+            """Dial's bucket queue for integer keys where every pushed key is within max_weight of the minimum."""
+            self.buckets = [[] for _ in range(max_weight + 1)]
+            self.cursor = 0
+            self.size = 0
+
+        def __len__(self):
+            return self.size
+
+        def push(self, key, item):
+            if not isinstance(key, int) or not self.cursor <= key < self.cursor + len(self.buckets):
+                raise ValueError("Dial's bucket queue needs integer keys within max_weight of the minimum "
+                                 "(non-negative integer edge weights up to max_weight).")
+            self.buckets[key % len(self.buckets)].append((key, item))
+            self.size += 1
+
+        def pop(self):
+            buckets = self.buckets
+            while not buckets[self.cursor % len(buckets)]:
+                self.cursor += 1
+            self.size -= 1
+            return buckets[self.cursor % len(buckets)].pop()
+
+    class RadixHeap:
+        def __init__(self):
+            """Radix heap for monotone non-negative integer keys (no key smaller than the last pop)."""
+            self.buckets = [[] for _ in range(65)]
+            self.last = 0
+            self.size = 0
+
+        def __len__(self):
+            return self.size
+
+        def push(self, key, item):
+            if not isinstance(key, int) or key < self.last or key >> 64:
+                raise ValueError("Radix heap needs monotone integer keys below 2**64 "
+                                 "(non-negative integer edge weights).")
+            self.buckets[(key ^ self.last).bit_length()].append((key, item))
+            self.size += 1
+
+        def pop(self):
+            buckets = self.buckets
+            if not buckets[0]:
+                i = 1
+                while not buckets[i]:
+                    i += 1
+                # Every entry of the first non-empty bucket moves to a lower bucket relative to its minimum.
+                entries = buckets[i]
+                buckets[i] = []
+                self.last = min(entries)[0]
+                for key, item in entries:
+                    buckets[(key ^ self.last).bit_length()].append((key, item))
+            self.size -= 1
+            return buckets[0].pop()
+
+    @staticmethod
+    def _edges(graph):
+        """Returns a node -> iterable of (neighbor, weight) accessor for dict graphs and graph objects with edges()."""
+        return getattr(graph, "edges", None) or graph.__getitem__
+
+    @staticmethod
+    def dijkstra_path(graph, source, target=None, queue="binary", max_weight=None):
+        """Dijkstra from source that stops as soon as target is settled.
+
+        Distances and predecessors are dicts filled lazily, only for nodes that were reached.
+        queue selects the priority queue: "binary" (heap), "dial" (bucket queue, small
+        non-negative integer weights) or "radix" (radix heap, non-negative integer weights).
+        Dial's queue is sized by max_weight; it defaults to the cached CSRGraph.max_weight, but dict
+        graphs need a scan of every edge, so pass it for repeated queries. Weights are validated as
+        they are relaxed. Returns (distances, predecessors, path); path is [] when target is
+        unreachable or None.
+        """
+        edges = GraphAlgorithms._edges(graph)
+        if queue == "binary":
+            pq = GraphAlgorithms.BinaryHeapQueue()
+        elif queue == "dial":
+            if max_weight is None:
+                if isinstance(graph, GraphAlgorithms.CSRGraph):
+                    max_weight = graph.max_weight
+                else:
+                    max_weight = max((w for node in graph for _, w in graph[node]), default=0)
+            if not isinstance(max_weight, int) or max_weight < 0:
+                raise ValueError("Dial's bucket queue needs non-negative integer weights.")
+            pq = GraphAlgorithms.DialBucketQueue(max_weight)
+        elif queue == "radix":
+            pq = GraphAlgorithms.RadixHeap()
+        else:
+            raise ValueError(f"Unknown queue type: {queue!r}")
+
+        distances = {source: 0}
+        predecessors = {source: None}
+        settled = set()
+        pq.push(0, source)
+        while pq:
+            current_distance, u = pq.pop()
+            if u in settled or current_distance > distances[u]:
+                continue
+            settled.add(u)
+            if u == target:
+                break
+            for v, weight in edges(u):
+                distance = current_distance + weight
+                if v not in distances or distance < distances[v]:
+                    distances[v] = distance
+                    predecessors[v] = u
+                    pq.push(distance, v)
+
+        path = []
+        if target is not None and target in settled:
+            node = target
+            while node is not None:
+                path.append(node)
+                node = predecessors[node]
+            path.reverse()
+        return distances, predecessors, path
+
+    @staticmethod
+    def _johnson_init(graph, h):
+        """Pool initializer: keeps the reweighted graph and potentials in each worker process."""
+        GraphAlgorithms._johnson_state = (graph, h)
+
+    @staticmethod
+    def _johnson_row(source, state=None):
+        """Runs Dijkstra on the reweighted graph and undoes the reweighting for one source row."""
+        graph, h = state or GraphAlgorithms._johnson_state
+        distances = GraphAlgorithms.dijkstra(graph, source)
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            for v in range(graph.num_nodes):
+                distances[v] += h[v] - h[source]
+            return source, distances
+        return source, {v: d - h[source] + h[v] for v, d in distances.items()}
+
+    @staticmethod
+    def johnson(graph, sources=None, workers=1):
+        """Performs Johnson's Algorithm, yielding (source, distances) one row at a time.
+
+        Bellman-Ford from a virtual node computes potentials h that make every edge weight
+        non-negative, then one Dijkstra per source runs on the reweighted graph, fanned out over
+        a process pool when workers > 1. Rows are streamed, so the full V x V matrix is never held.
+        Raises ValueError if the graph has a negative-weight cycle.
+        """
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            n, m = graph.num_nodes, graph.num_edges
+            # The virtual node n gets a zero-weight edge to every node; appending its row is O(V).
+            augmented = GraphAlgorithms.CSRGraph(
+                graph.offsets + array.array('q', [m + n]),
+                graph.targets + array.array('l', range(n)),
+                graph.weights + array.array(graph.weights.typecode, [0]) * n,
+                graph.labels + [object()])
+            h = GraphAlgorithms.bellman_ford(augmented, n)
+            nodes = range(n)
+        else:
+            virtual = object()
+            augmented = dict(graph)
+            augmented[virtual] = [(node, 0) for node in graph]
+            h = GraphAlgorithms.bellman_ford(augmented, virtual)
+            nodes = list(graph)
+
+        edges = GraphAlgorithms._edges(graph)
+        for u in nodes:
+            for v, weight in edges(u):
+                if h[u] + weight < h[v]:
+                    raise ValueError("Graph contains a negative-weight cycle.")
+
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            sources_of = graph.sources()
+            reweighted = GraphAlgorithms.CSRGraph(
+                graph.offsets, graph.targets,
+                array.array('d', [w + h[u] - h[v] for u, v, w in zip(sources_of, graph.targets, graph.weights)]),
+                graph.labels)
+        else:
+            reweighted = {u: [(v, w + h[u] - h[v]) for v, w in graph[u]] for u in graph}
+
+        sources = nodes if sources is None else sources
+        if workers == 1:
+            for source in sources:
+                yield GraphAlgorithms._johnson_row(source, (reweighted, h))
+            return
+        with multiprocessing.Pool(workers, initializer=GraphAlgorithms._johnson_init,
+                                  initargs=(reweighted, h)) as pool:
+            yield from pool.imap(GraphAlgorithms._johnson_row, sources, chunksize=16)
+
+    @staticmethod
+    def floyd_warshall_numpy(graph, block_size=None):
+        """Performs Floyd-Warshall on a NumPy distance matrix, one broadcasted update per k.
+
+        graph may be a dict graph, a CSRGraph or a square matrix (inf where there is no edge);
+        matrix rows follow list(graph) for dicts and node ids for CSR graphs. With block_size set,
+        the cache-blocked (tiled) three-phase variant is used. Returns (dist, next_hop), where
+        next_hop[i, j] is the node after i on a shortest i -> j path (-1 if unreachable).
+        Raises ValueError if a negative-weight cycle shows up on the diagonal.
+        """
+        if np is None:
+            raise ImportError("floyd_warshall_numpy requires NumPy.")
+        if isinstance(graph, np.ndarray):
+            dist = graph.astype(np.float64)
+            n = dist.shape[0]
+        else:
+            if isinstance(graph, GraphAlgorithms.CSRGraph):
+                nodes = range(graph.num_nodes)
+                position = None
+            else:
+                nodes = list(graph)
+                position = {node: i for i, node in enumerate(nodes)}
+            n = len(nodes)
+            dist = np.full((n, n), np.inf)
+            edges = GraphAlgorithms._edges(graph)
+            for i, u in enumerate(nodes):
+                for v, weight in edges(u):
+                    j = v if position is None else position[v]
+                    if weight < dist[i, j]:
+                        dist[i, j] = weight
+        np.fill_diagonal(dist, np.minimum(dist.diagonal(), 0))
+        next_hop = np.where(np.isfinite(dist), np.arange(n), -1)
+
+        if block_size is None or block_size >= n:
+            for k in range(n):
+                candidate = dist[:, k, None] + dist[None, k, :]
+                np.copyto(next_hop, next_hop[:, k, None], where=candidate < dist)
+                np.minimum(dist, candidate, out=dist)
+        else:
+            # Ties in distance are broken by hop count, so zero-weight cycles cannot make the next-hop
+            # matrix circular when tiles are relaxed out of the textbook k order.
+            hops = np.ones((n, n), dtype=np.int64)
+            np.fill_diagonal(hops, 0)
+
+            def relax(i0, i1, j0, j1, k0, k1):
+                """Relaxes tile [i0:i1, j0:j1] through intermediate nodes k0..k1-1."""
+                d = dist[i0:i1, j0:j1]
+                nh = next_hop[i0:i1, j0:j1]
+                h = hops[i0:i1, j0:j1]
+                for k in range(k0, k1):
+                    candidate = dist[i0:i1, k, None] + dist[None, k, j0:j1]
+                    candidate_hops = hops[i0:i1, k, None] + hops[None, k, j0:j1]
+                    shorter = (candidate < d) | ((candidate == d) & (candidate_hops < h) & np.isfinite(candidate))
+                    np.copyto(d, candidate, where=shorter)
+                    np.copyto(h, candidate_hops, where=shorter)
+                    np.copyto(nh, np.broadcast_to(next_hop[i0:i1, k, None], nh.shape), where=shorter)
+
+            blocks = [(b, min(b + block_size, n)) for b in range(0, n, block_size)]
+            for k0, k1 in blocks:
+                # Phase 1: the diagonal tile, then its row and column, then everything else.
+                relax(k0, k1, k0, k1, k0, k1)
+                for j0, j1 in blocks:
+                    if j0 != k0:
+                        relax(k0, k1, j0, j1, k0, k1)
+                        relax(j0, j1, k0, k1, k0, k1)
+                for i0, i1 in blocks:
+                    for j0, j1 in blocks:
+                        if i0 != k0 and j0 != k0:
+                            relax(i0, i1, j0, j1, k0, k1)
+
+        if (dist.diagonal() < 0).any():
+            raise ValueError("Graph contains a negative-weight cycle.")
+        return dist, next_hop
+
+    @staticmethod
+    def floyd_warshall_path(next_hop, u, v):
+        """Reconstructs the shortest u -> v path (as matrix indices) from a next-hop matrix."""
+        if next_hop[u, v] == -1:
+            return []
+        path = [u]
+        while u != v:
+            u = int(next_hop[u, v])
+            path.append(u)
+        return path
+
+    @staticmethod
+    def spfa(graph, start):
+        """Queue-based Bellman-Ford (SPFA) with the small-label-first heuristic.
+
+        Only out-edges of nodes whose distance changed are relaxed, so it stops as soon as a round
+        changes nothing. Returns (distances, predecessors, negative_cycle), where negative_cycle
+        is the list of nodes of a negative-weight cycle reachable from start, or None.
+        """
+        if isinstance(graph, GraphAlgorithms.CSRGraph):
+            nodes = range(graph.num_nodes)
+        else:
+            nodes = graph
+        edges = GraphAlgorithms._edges(graph)
+        num_nodes = len(graph)
+        distances = {node: float('inf') for node in nodes}
+        predecessors = {node: None for node in nodes}
+        # Number of edges on the current shortest path; reaching num_nodes means a cycle.
+        path_length = {start: 0}
+        distances[start] = 0
+        queue = deque([start])
+        in_queue = {start}
+
+        def find_cycle(node):
+            seen = set()
+            while node is not None and node not in seen:
+                seen.add(node)
+                node = predecessors[node]
+            if node is None:
+                return None
+            cycle = [node]
+            current = predecessors[node]
+            while current != node:
+                cycle.append(current)
+                current = predecessors[current]
+            cycle.reverse()
+            return cycle
+
+        while queue:
+            u = queue.popleft()
+            in_queue.discard(u)
+            du = distances[u]
+            for v, weight in edges(u):
+                if du + weight < distances[v]:
+                    distances[v] = du + weight
+                    predecessors[v] = u
+                    path_length[v] = path_length[u] + 1
+                    if path_length[v] >= num_nodes:
+                        cycle = find_cycle(v)
+                        if cycle is not None:
+                            return distances, predecessors, cycle
+                    if v not in in_queue:
+                        in_queue.add(v)
+                        # Small label first: a node better than the queue head is processed next.
+                        if queue and distances[v] < distances[queue[0]]:
+                            queue.appendleft(v)
+                        else:
+                            queue.append(v)
+        return distances, predecessors, None
+
+    class OccupancyGrid:
+        def __init__(self, width, height, blocked=None, diagonal=False):
+            """Implicit grid graph: cell (x, y) is node y * width + x and blocked[node] != 0 marks an obstacle."""
+            self.width = width
+            self.height = height
+            self.cells = bytearray(blocked) if blocked is not None else bytearray(width * height)
+            self.diagonal = diagonal
+            moves = [(1, 0, 1), (-1, 0, 1), (0, 1, 1), (0, -1, 1)]
+            if diagonal:
+                moves += [(dx, dy, math.sqrt(2)) for dx in (1, -1) for dy in (1, -1)]
+            self.moves = moves
+
+        def __len__(self):
+            return self.width * self.height
+
+        def node(self, x, y):
+            return y * self.width + x
+
+        def coords(self, node):
+            return node % self.width, node // self.width
+
+        def edges(self, node):
+            """Yields (neighbor, cost) for free neighboring cells; diagonal moves may not cut corners."""
+            width, height, cells = self.width, self.height, self.cells
+            x, y = node % width, node // width
+            for dx, dy, cost in self.moves:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height and not cells[ny * width + nx]:
+                    if dx and dy and (cells[y * width + nx] or cells[ny * width + x]):
+                        continue
+                    yield ny * width + nx, cost
+
+        def heuristic(self, a, b):
+            """Octile distance on 8-connected grids, Manhattan distance on 4-connected ones."""
+            dx = abs(a % self.width - b % self.width)
+            dy = abs(a // self.width - b // self.width)
+            if self.diagonal:
+                return max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy)
+            return dx + dy
+
+    @staticmethod
+    def a_star_search(graph, start, goal, heuristic=None, bidirectional=False, reverse_graph=None):
+        """A* search with a closed set and a heuristic callable heuristic(u, v) estimating dist(u, v).
+
+        graph may be a dict graph, a CSRGraph or an OccupancyGrid (whose heuristic is the default).
+        Ties on f are broken toward larger g, and with a consistent heuristic every node is expanded
+        at most once. bidirectional=True searches from both ends (reverse_graph defaults to graph).
+        Returns (path, cost); path is [] and cost is inf when goal is unreachable.
+        """
+        if heuristic is None:
+            heuristic = getattr(graph, "heuristic", None) or (lambda u, v: 0)
+        if bidirectional:
+            return GraphAlgorithms._bidirectional_a_star(graph, start, goal, heuristic, reverse_graph)
+        edges = GraphAlgorithms._edges(graph)
+        g_costs = {start: 0}
+        came_from = {start: None}
+        closed = set()
+        open_list = [(heuristic(start, goal), 0, start)]
+        while open_list:
+            _, neg_g, current = heapq.heappop(open_list)
+            if current in closed:
+                continue
+            if current == goal:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = came_from[current]
+                return path[::-1], -neg_g
+            closed.add(current)
+            g = -neg_g
+            for neighbor, weight in edges(current):
+                if neighbor in closed:
+                    continue
+                tentative_g = g + weight
+                if neighbor not in g_costs or tentative_g < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g
+                    came_from[neighbor] = current
+                    heapq.heappush(open_list, (tentative_g + heuristic(neighbor, goal), -tentative_g, neighbor))
+        return [], float('inf')
+
+    @staticmethod
+    def _bidirectional_a_star(graph, start, goal, heuristic, reverse_graph=None):
+        """Bidirectional A* with the average potential p(v) = (h(v, goal) - h(start, v)) / 2.
+
+        Both searches see the same non-negative reduced costs, so the search can stop as soon as
+        the two smallest keys add up to at least the best start -> goal path found so far.
+        """
+        forward = GraphAlgorithms._edges(graph)
+        backward = GraphAlgorithms._edges(reverse_graph if reverse_graph is not None else graph)
+        potential = lambda v: (heuristic(v, goal) - heuristic(start, v)) / 2
+        dist = ({start: 0}, {goal: 0})
+        parent = ({start: None}, {goal: None})
+        closed = (set(), set())
+        queues = ([(potential(start), start)], [(-potential(goal), goal)])
+        signs = (1, -1)
+        best, meeting = float('inf'), None
+        if start == goal:
+            best, meeting = 0, start
+        while queues[0] and queues[1] and queues[0][0][0] + queues[1][0][0] < best:
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            _, u = heapq.heappop(queues[side])
+            if u in closed[side]:
+                continue
+            closed[side].add(u)
+            d, other = dist[side], dist[1 - side]
+            for v, weight in (forward if side == 0 else backward)(u):
+                nd = d[u] + weight
+                if v not in d or nd < d[v]:
+                    d[v] = nd
+                    parent[side][v] = u
+                    heapq.heappush(queues[side], (nd + signs[side] * potential(v), v))
+                    if v in other and nd + other[v] < best:
+                        best, meeting = nd + other[v], v
+        if meeting is None:
+            return [], float('inf')
+        path = []
+        node = meeting
+        while node is not None:
+            path.append(node)
+            node = parent[0][node]
+        path.reverse()
+        node = parent[1][meeting]
+        while node is not None:
+            path.append(node)
+            node = parent[1][node]
+        return path, best
+
+    class ContractionHierarchy:
+        WITNESS_SETTLE_LIMIT = 60
+
+        def __init__(self, graph):
+            """Contraction hierarchy index over a dict graph or CSRGraph for fast repeated shortest-path queries.
+
+            Nodes are contracted in edge-difference order (with lazy priority updates), adding a
+            shortcut u -> w whenever a bounded witness search finds no path shorter than u -> v -> w.
+            Dict graphs are queried by label, CSR graphs by node id.
+            """
+            if isinstance(graph, GraphAlgorithms.CSRGraph):
+                csr, self.labels = graph, None
+            else:
+                csr = GraphAlgorithms.CSRGraph.from_dict(graph)
+                self.labels = csr.labels
+            n = csr.num_nodes
+            out_edges = [{} for _ in range(n)]
+            in_edges = [{} for _ in range(n)]
+            for u in range(n):
+                for v, w in csr.edges(u):
+                    if u != v and w < out_edges[u].get(v, float('inf')):
+                        out_edges[u][v] = in_edges[v][u] = w
+            self.middle = {}
+            self.rank = array.array('l', [0]) * n
+            up, down = [None] * n, [None] * n
+            deleted_neighbors = [0] * n
+
+            def shortcuts_for(v):
+                """Returns the (u, w, weight) shortcuts that contracting v would require."""
+                needed = []
+                for u, w_uv in in_edges[v].items():
+                    targets = {x: w_uv + w_vx for x, w_vx in out_edges[v].items() if x != u}
+                    if not targets:
+                        continue
+                    limit = max(targets.values())
+                    dist = {u: 0}
+                    heap = [(0, u)]
+                    settled = 0
+                    while heap and settled < GraphAlgorithms.ContractionHierarchy.WITNESS_SETTLE_LIMIT:
+                        d, x = heapq.heappop(heap)
+                        if d > dist[x]:
+                            continue
+                        if d > limit:
+                            break
+                        settled += 1
+                        for y, w_xy in out_edges[x].items():
+                            if y != v and d + w_xy < dist.get(y, float('inf')):
+                                dist[y] = d + w_xy
+                                heapq.heappush(heap, (d + w_xy, y))
+                    for x, via in targets.items():
+                        if via < dist.get(x, float('inf')):
+                            needed.append((u, x, via))
+                return needed
+
+            def priority(v):
+                return len(shortcuts_for(v)) - len(in_edges[v]) - len(out_edges[v]) + deleted_neighbors[v]
+
+            heap = [(priority(v), v) for v in range(n)]
+            heapq.heapify(heap)
+            order = 0
+            while heap:
+                _, v = heapq.heappop(heap)
+                current = priority(v)
+                if heap and current > heap[0][0]:
+                    heapq.heappush(heap, (current, v))
+                    continue
+                self.rank[v] = order
+                order += 1
+                for u, x, weight in shortcuts_for(v):
+                    if weight < out_edges[u].get(x, float('inf')):
+                        out_edges[u][x] = in_edges[x][u] = weight
+                        self.middle[(u, x)] = v
+                # Every remaining neighbor is contracted later, i.e. ranks higher than v.
+                up[v], down[v] = out_edges[v], in_edges[v]
+                for x in out_edges[v]:
+                    del in_edges[x][v]
+                    deleted_neighbors[x] += 1
+                for u in in_edges[v]:
+                    del out_edges[u][v]
+                    deleted_neighbors[u] += 1
+                out_edges[v], in_edges[v] = {}, {}
+
+            # up holds edges to higher-ranked nodes; down holds reversed edges from higher-ranked nodes.
+            self.up = GraphAlgorithms.CSRGraph.from_edges(
+                ((u, x, w) for u in range(n) for x, w in up[u].items()), nodes=range(n))
+            self.down = GraphAlgorithms.CSRGraph.from_edges(
+                ((x, u, w) for x in range(n) for u, w in down[x].items()), nodes=range(n))
+            self.index = {label: i for i, label in enumerate(self.labels)} if self.labels else None
+
+        def save(self, path):
+            """Serializes the index to disk."""
+            with open(path, "wb") as f:
+                pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        @staticmethod
+        def load(path):
+            """Loads an index written by save() without rebuilding it."""
+            with open(path, "rb") as f:
+                return pickle.load(f)
+
+        def query(self, source, target):
+            """Returns (distance, path) for the shortest source -> target path, or (inf, []) if none."""
+            if self.index is not None:
+                source, target = self.index[source], self.index[target]
+            graphs = (self.up, self.down)
+            dist = ({source: 0}, {target: 0})
+            parent = ({source: None}, {target: None})
+            heaps = ([(0, source)], [(0, target)])
+            best, meeting = (0, source) if source == target else (float('inf'), None)
+            while heaps[0] or heaps[1]:
+                side = 0 if heaps[0] and (not heaps[1] or heaps[0][0][0] <= heaps[1][0][0]) else 1
+                d, u = heapq.heappop(heaps[side])
+                if d >= best:
+                    heaps[side].clear()
+                    continue
+                if d > dist[side][u]:
+                    continue
+                graph = graphs[side]
+                offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+                for e in range(offsets[u], offsets[u + 1]):
+                    v, nd = targets[e], d + weights[e]
+                    if nd < dist[side].get(v, float('inf')):
+                        dist[side][v] = nd
+                        parent[side][v] = u
+                        heapq.heappush(heaps[side], (nd, v))
+                        if v in dist[1 - side] and nd + dist[1 - side][v] < best:
+                            best, meeting = nd + dist[1 - side][v], v
+            if meeting is None:
+                return float('inf'), []
+
+            hops = []
+            node = meeting
+            while node is not None:
+                hops.append(node)
+                node = parent[0][node]
+            hops.reverse()
+            node = parent[1][meeting]
+            while node is not None:
+                hops.append(node)
+                node = parent[1][node]
+            # Unpack shortcuts: (u, w) -> (u, middle) + (middle, w), until only original edges remain.
+            path = [hops[0]]
+            for a, b in zip(hops, hops[1:]):
+                stack = [(a, b)]
+                while stack:
+                    a, b = stack.pop()
+                    m = self.middle.get((a, b))
+                    if m is None:
+                        path.append(b)
+                    else:
+                        stack.append((m, b))
+                        stack.append((a, m))
+            if self.labels is not None:
+                path = [self.labels[node] for node in path]
+            return best, path
+
+    @staticmethod
+    def _dijkstra_csr(graph, start):
+        """Dijkstra over a CSRGraph; returns an array of distances indexed by node id."""
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        distances = array.array('d', [float('inf')]) * graph.num_nodes
+        distances[start] = 0
+        priority_queue = [(0, start)]
+        while priority_queue:
+            current_distance, u = heapq.heappop(priority_queue)
+            if current_distance > distances[u]:
+                continue
+            for e in range(offsets[u], offsets[u + 1]):
+                distance = current_distance + weights[e]
+                v = targets[e]
+                if distance < distances[v]:
+                    distances[v] = distance
+                    heapq.heappush(priority_queue, (distance, v))
+        return distances
+
+    @staticmethod
+    def _bellman_ford_csr(graph, start):
+        """Bellman-Ford over a CSRGraph; returns an array of distances indexed by node id."""
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        inf = float('inf')
+        distances = array.array('d', [inf]) * graph.num_nodes
+        distances[start] = 0
+        for _ in range(graph.num_nodes - 1):
+            for u in range(graph.num_nodes):
+                du = distances[u]
+                if du == inf:
+                    continue
+                for e in range(offsets[u], offsets[u + 1]):
+                    if du + weights[e] < distances[targets[e]]:
+                        distances[targets[e]] = du + weights[e]
+        return distances
+
+    @staticmethod
+    def _kruskal_csr(graph):
+        """Kruskal over a CSRGraph; returns MST edges as (u, v, weight) id triples."""
+        weights, targets = graph.weights, graph.targets
+        sources = graph.sources()
+        order = sorted(range(len(targets)), key=weights.__getitem__)
+        edges = ((sources[e], targets[e], weights[e]) for e in order)
+        return GraphAlgorithms.kruskal_stream(edges, graph.num_nodes)
+
+    @staticmethod
+    def _prim_csr(graph, start):
+        """Prim over a CSRGraph; returns MST edges as (u, v, weight) id triples."""
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        visited = bytearray(graph.num_nodes)
+        visited[start] = 1
+        mst = []
+        edges = [(weights[e], start, targets[e]) for e in range(offsets[start], offsets[start + 1])]
+        heapq.heapify(edges)
+        while edges:
+            weight, u, v = heapq.heappop(edges)
+            if not visited[v]:
+                visited[v] = 1
+                mst.append((u, v, weight))
+                for e in range(offsets[v], offsets[v + 1]):
+                    if not visited[targets[e]]:
+                        heapq.heappush(edges, (weights[e], v, targets[e]))
+        return mst
+
+    @staticmethod
+    def _topological_sort_csr(graph):
+        """Kahn's algorithm over a CSRGraph; returns a list of node ids."""
+        offsets, targets = graph.offsets, graph.targets
+        in_degree = array.array('l', [0]) * graph.num_nodes
+        for v in targets:
+            in_degree[v] += 1
+        queue = deque(u for u in range(graph.num_nodes) if in_degree[u] == 0)
+        sorted_list = []
+        while queue:
+            u = queue.popleft()
+            sorted_list.append(u)
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    queue.append(v)
+        if len(sorted_list) < graph.num_nodes:
+            raise ValueError(f"Graph contains a cycle: {GraphAlgorithms._find_cycle_csr(graph)}")
+        return sorted_list
+
+    @staticmethod
+    def _find_cycle_csr(graph):
+        """Iterative three-colour DFS over a CSRGraph; returns the first cycle found as node ids, or None."""
+        n, offsets, targets = graph.num_nodes, graph.offsets, graph.targets
+        # depth[v] is -1 while unvisited, v's index on call_stack while active, and n once finished.
+        depth = array.array('l', [-1]) * n
+        next_edge = array.array('q', offsets[:-1])
+        for root in range(n):
+            if depth[root] != -1:
+                continue
+            call_stack = [root]
+            depth[root] = 0
+            while call_stack:
+                v = call_stack[-1]
+                e = next_edge[v]
+                if e < offsets[v + 1]:
+                    next_edge[v] = e + 1
+                    w = targets[e]
+                    if depth[w] == -1:
+                        depth[w] = len(call_stack)
+                        call_stack.append(w)
+                    elif depth[w] < n:
+                        return call_stack[depth[w]:]
+                    continue
+                depth[call_stack.pop()] = n
+        return None
+
+    @staticmethod
+    def _tarjan_csr(graph):
+        """Iterative Tarjan over a CSRGraph; returns SCCs as lists of node ids in reverse topological order."""
+        count, component = GraphAlgorithms._tarjan_components(graph)
+        sccs = [[] for _ in range(count)]
+        for v in range(graph.num_nodes):
+            sccs[count - 1 - component[v]].append(v)
+        return sccs
+
+    @staticmethod
+    def _tarjan_components(graph):
+        """Iterative Tarjan over a CSRGraph; returns (count, component ids in topological order)."""
+        n, offsets, targets = graph.num_nodes, graph.offsets, graph.targets
+        indices = array.array('l', [-1]) * n
+        lowlink = array.array('l', [0]) * n
+        component = array.array('l', [-1]) * n
+        next_edge = array.array('q', offsets[:-1])
         stack = []
-        indices = {}
-        lowlink = {}
-        on_stack = set()
-        sccs = []
-
-        def strongconnect(v):
-            nonlocal index
-            indices[v] = lowlink[v] = index
+        index = count = 0
+        for root in range(n):
+            if indices[root] != -1:
+                continue
+            call_stack = [root]
+            indices[root] = lowlink[root] = index
             index += 1
-            stack.append(v)
-            on_stack.add(v)
-
-            for w in graph[v]:
-                if w not in indices:
-                    strongconnect(w)
-                    lowlink[v] = min(lowlink[v], lowlink[w])
-                elif w in on_stack:
-                    lowlink[v] = min(lowlink[v], indices[w])
-
-            if lowlink[v] == indices[v]:
-                scc = []
-                while True:
-                    w = stack.pop()
-                    on_stack.remove(w)
-                    scc.append(w)
-                    if w == v:
-                        break
-                sccs.append(scc)
+            stack.append(root)
+            while call_stack:
+                v = call_stack[-1]
+                e = next_edge[v]
+                if e < offsets[v + 1]:
+                    next_edge[v] = e + 1
+                    w = targets[e]
+                    if indices[w] == -1:
+                        indices[w] = lowlink[w] = index
+                        index += 1
+                        stack.append(w)
+                        call_stack.append(w)
+                    elif component[w] == -1 and indices[w] < lowlink[v]:
+                        # Visited but not yet assigned a component means w is still on the stack.
+                        lowlink[v] = indices[w]
+                    continue
+                call_stack.pop()
+                if call_stack and lowlink[v] < lowlink[call_stack[-1]]:
+                    lowlink[call_stack[-1]] = lowlink[v]
+                if lowlink[v] == indices[v]:
+                    while True:
+                        w = stack.pop()
+                        component[w] = count
+                        if w == v:
+                            break
+                    count += 1
+        # Tarjan emits sink components first; flip the ids into topological order.
+        for v in range(n):
+            component[v] = count - 1 - component[v]
+        return count, component
 
-        for node in graph:
-            if node not in indices:
-                strongconnect(node)
+    @staticmethod
+    def _kosaraju_components(graph):
+        """Iterative Kosaraju over a CSRGraph; returns (count, component ids in topological order)."""
+        n, offsets, targets = graph.num_nodes, graph.offsets, graph.targets
+        visited = bytearray(n)
+        next_edge = array.array('q', offsets[:-1])
+        finished = array.array('l')
+        for root in range(n):
+            if visited[root]:
+                continue
+            visited[root] = 1
+            call_stack = [root]
+            while call_stack:
+                v = call_stack[-1]
+                e = next_edge[v]
+                if e < offsets[v + 1]:
+                    next_edge[v] = e + 1
+                    w = targets[e]
+                    if not visited[w]:
+                        visited[w] = 1
+                        call_stack.append(w)
+                else:
+                    call_stack.pop()
+                    finished.append(v)
 
-        return sccs
+        # Sweeping the transpose in decreasing finish time peels off components in topological order.
+        transpose = graph.reverse()
+        offsets, targets = transpose.offsets, transpose.targets
+        component = array.array('l', [-1]) * n
+        count = 0
+        for root in reversed(finished):
+            if component[root] != -1:
+                continue
+            component[root] = count
+            stack = [root]
+            while stack:
+                v = stack.pop()
+                for e in range(offsets[v], offsets[v + 1]):
+                    w = targets[e]
+                    if component[w] == -1:
+                        component[w] = count
+                        stack.append(w)
+            count += 1
+        return count, component
+
+    @staticmethod
+    def benchmark(n=1000, degree=4, grid=30, queries=200, scc_nodes=200000, scc_edges=1000000):
+        """Times SPFA against Bellman-Ford, contraction hierarchy queries against Dijkstra, and both SCC engines."""
+        def timed(fn):
+            start = time.perf_counter()
+            fn()
+            return time.perf_counter() - start
+
+        graph = {u: [(random.randrange(n), random.randint(1, 100)) for _ in range(degree)] for u in range(n)}
+        csr = GraphAlgorithms.CSRGraph.from_dict(graph)
+        print(f"Single-source shortest paths benchmark (n={n}, m={n * degree}):")
+        for name, g in (("dict", graph), ("CSR", csr)):
+            baseline = timed(lambda: GraphAlgorithms.bellman_ford(g, 0))
+            elapsed = timed(lambda: GraphAlgorithms.spfa(g, 0))
+            print(f"  {name:<5} bellman_ford: {baseline:.4f}s  spfa: {elapsed:.4f}s  speedup: {baseline / elapsed:.1f}x")
+
+        road = GraphAlgorithms.OccupancyGrid(grid, grid)
+        road = GraphAlgorithms.CSRGraph.from_edges(
+            ((u, v, random.randint(1, 100)) for u in range(grid * grid) for v, _ in road.edges(u)),
+            nodes=range(grid * grid))
+        pairs = [(random.randrange(len(road)), random.randrange(len(road))) for _ in range(queries)]
+        ch = None
+
+        def build():
+            nonlocal ch
+            ch = GraphAlgorithms.ContractionHierarchy(road)
+
+        preprocessing = timed(build)
+        shortcuts = ch.up.num_edges + ch.down.num_edges - road.num_edges
+        size = len(pickle.dumps(ch, protocol=pickle.HIGHEST_PROTOCOL))
+        baseline = timed(lambda: [GraphAlgorithms.dijkstra_path(road, s, t) for s, t in pairs]) / queries
+        elapsed = timed(lambda: [ch.query(s, t) for s, t in pairs]) / queries
+        print(f"Contraction hierarchy benchmark ({grid}x{grid} grid, {queries} queries):")
+        print(f"  preprocessing: {preprocessing:.3f}s  shortcuts: {shortcuts}  index size: {size / 1024:.1f} KiB")
+        print(f"  dijkstra: {baseline * 1000:.3f}ms/query  ch: {elapsed * 1000:.3f}ms/query  speedup: {baseline / elapsed:.1f}x")
+
+        # A long chain plus random edges: deep enough to overflow a recursive DFS.
+        edges = [(u, u + 1) for u in range(scc_nodes - 1)]
+        edges += [(random.randrange(scc_nodes), random.randrange(scc_nodes)) for _ in range(scc_edges - len(edges))]
+        dependencies = GraphAlgorithms.CSRGraph.from_edges(edges, nodes=range(scc_nodes))
+        print(f"Strongly connected components benchmark (n={scc_nodes}, m={len(edges)}):")
+        for algorithm in ("tarjan", "kosaraju"):
+            elapsed = timed(lambda: GraphAlgorithms.strongly_connected_components(dependencies, algorithm))
+            print(f"  {algorithm:<9} {elapsed:.3f}s")
+        elapsed = timed(lambda: GraphAlgorithms.strongly_connected_components(dependencies, condensation=True))
+        print(f"  tarjan + condensation DAG: {elapsed:.3f}s")
     
     @staticmethod
     def main():
@@ -244,6 +1501,8 @@ class GraphAlgorithms:
 
         # Test Kruskal's Algorithm
         print("Kruskal's Algorithm:", GraphAlgorithms.kruskal(graph))
+        print("Boruvka's Algorithm:", GraphAlgorithms.boruvka(graph, workers=2))
+        print("Kruskal's Algorithm (sorted stream):", GraphAlgorithms.kruskal_stream([(0, 1, 1), (2, 3, 1), (1, 2, 2), (0, 2, 4)], 4))
 
         # Test Prim's Algorithm
         print("Prim's Algorithm:", GraphAlgorithms.prim(graph, 'A'))
@@ -256,6 +1515,17 @@ class GraphAlgorithms:
             'D': [],
         }
         print("Topological Sort:", GraphAlgorithms.topological_sort(dag))
+        print("Topological Levels:", GraphAlgorithms.topological_levels(dag))
+        print("Level-scheduled run:", GraphAlgorithms.run_topological_levels(dag, str.lower, workers=2, threads=True))
+        print("Find Cycle:", GraphAlgorithms.find_cycle({'A': ['B'], 'B': ['C'], 'C': ['A']}))
+        online = GraphAlgorithms.OnlineTopologicalOrder(edges=[('C', 'D'), ('B', 'C')])
+        online.add_edge('D', 'E')
+        online.add_edge('A', 'B')
+        print("Online Topological Order:", online.order())
+        try:
+            online.add_edge('E', 'B')
+        except ValueError as e:
+            print("Online Topological Order rejected:", e)
 
         # Test Tarjan's Algorithm (SCCs)
         graph_scc = {
@@ -267,6 +1537,54 @@ class GraphAlgorithms:
         }
         print("Tarjan's Algorithm (SCCs):", GraphAlgorithms.tarjan(graph_scc))
 
+        # Test SCC component ids and the condensation DAG with both engines
+        for algorithm in ("tarjan", "kosaraju"):
+            component, dag = GraphAlgorithms.strongly_connected_components(graph_scc, algorithm, condensation=True)
+            print(f"SCC components ({algorithm}):", component, "condensation DAG 0 ->", list(dag.neighbors(0)))
+
+        # Test Point-to-Point Dijkstra with each priority queue
+        for queue in ("binary", "dial", "radix"):
+            distances, _, path = GraphAlgorithms.dijkstra_path(graph, 'A', 'D', queue=queue)
+            print(f"Dijkstra Path ({queue}):", path, "distance:", distances['D'])
+
+        # Test Johnson's Algorithm on a graph with a negative edge (rows are streamed)
+        negative = {'A': [('B', 4), ('C', 2)], 'B': [('D', 1)], 'C': [('B', -1), ('D', 5)], 'D': []}
+        for source, distances in GraphAlgorithms.johnson(negative, workers=2):
+            print(f"Johnson's Algorithm row {source}:", distances)
+
+        # Test the NumPy Floyd-Warshall (only when NumPy is installed)
+        if np is not None:
+            dist, next_hop = GraphAlgorithms.floyd_warshall_numpy(graph, block_size=2)
+            print("Floyd-Warshall (NumPy) A -> D:", dist[0, 3], "path:",
+                  [list(graph)[i] for i in GraphAlgorithms.floyd_warshall_path(next_hop, 0, 3)])
+
+        # Test SPFA, including negative-cycle reporting
+        distances, _, cycle = GraphAlgorithms.spfa(negative, 'A')
+        print("SPFA:", distances, "negative cycle:", cycle)
+        looping = {'A': [('B', 1)], 'B': [('C', -2)], 'C': [('B', 1), ('D', 3)], 'D': []}
+        print("SPFA negative cycle:", GraphAlgorithms.spfa(looping, 'A')[2])
+
+        # Test A* Search with a callable heuristic, on an occupancy grid, and bidirectionally
+        to_d = {'A': 4, 'B': 3, 'C': 1, 'D': 0}  # admissible and consistent estimates of the distance to D
+        print("A* Search:", GraphAlgorithms.a_star_search(graph, 'A', 'D', lambda u, v: to_d[u]))
+        walls = GraphAlgorithms.OccupancyGrid(5, 5, diagonal=True)
+        for y in range(4):
+            walls.cells[walls.node(2, y)] = 1
+        path, cost = GraphAlgorithms.a_star_search(walls, walls.node(0, 0), walls.node(4, 0), bidirectional=True)
+        print("A* Search (grid, bidirectional):", [walls.coords(node) for node in path], round(cost, 3))
+
+        # Test Contraction Hierarchies
+        ch = GraphAlgorithms.ContractionHierarchy(graph)
+        print("Contraction Hierarchy query A -> D:", ch.query('A', 'D'))
+
+        # Test the CSR representation (results are indexed by node id)
+        csr = GraphAlgorithms.CSRGraph.from_dict(graph)
+        print("CSR Graph labels:", csr.labels, "edges:", csr.num_edges)
+        print("Dijkstra's Algorithm (CSR):", list(GraphAlgorithms.dijkstra(csr, csr.index['A'])))
+        print("Kruskal's Algorithm (CSR):", GraphAlgorithms.kruskal(csr))
+        csr_scc = GraphAlgorithms.CSRGraph.from_dict(graph_scc, weighted=False)
+        print("Tarjan's Algorithm (CSR SCCs):", [[csr_scc.labels[v] for v in scc] for scc in GraphAlgorithms.tarjan(csr_scc)])
+
 
 # Main function to test the graph algorithms
 if __name__ == "__main__":
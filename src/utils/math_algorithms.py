@@ -34,14 +34,20 @@ class MathAlgorithms:
 
     # Fast Exponentiation (Exponentiation by Squaring)
     @staticmethod
-    def fast_exponentiation(base, exp):
-        """Calculates base raised to the power exp in logarithmic time."""
-        result = 1
+    def fast_exponentiation(base, exp, multiply=None, identity=1):
+        """Calculates base raised to the power exp in logarithmic time.
+
+        multiply and identity generalize the squaring to other monoids (matrices, polynomials, ...).
+        """
+        if multiply is None:
+            multiply = lambda a, b: a * b
+        result = identity
         while exp > 0:
             if exp % 2 == 1:
-                result *= base
-            base *= base
+                result = multiply(result, base)
             exp //= 2
+            if exp:
+                base = multiply(base, base)
         return result
 
     # Modular Arithmetic (Modular Exponentiation)
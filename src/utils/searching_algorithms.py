@@ -1,7 +1,16 @@
 #searching_algorithms.py
 
+import array
+import bisect
+import random
+import time
 from collections import deque
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python paths are used without it.
+    np = None
+
 class SearchingAlgorithms:
     """
     ### Searching Algorithms:
@@ -9,11 +18,17 @@ class SearchingAlgorithms:
     2. Binary Search
     3. Depth-First Search (DFS)
     4. Breadth-First Search (BFS)
+    5. Sorted Index (lower/upper bound, batched and Eytzinger search)
+    6. Iterative (generator) DFS / BFS
+    7. Bidirectional / Multi-Source / Direction-Optimizing BFS
     """
     
     @staticmethod
     def linear_search(arr, target):
         """Performs linear search to find the target element in the array."""
+        if np is not None and isinstance(arr, np.ndarray):
+            hits = np.flatnonzero(arr == target)
+            return int(hits[0]) if hits.size else -1
         for i in range(len(arr)):
             if arr[i] == target:
                 return i  # return index of target
@@ -21,7 +36,13 @@ class SearchingAlgorithms:
 
     @staticmethod
     def binary_search(arr, target):
-        """Performs binary search on a sorted array to find the target element."""
+        """Performs binary search on a sorted array to find the target element.
+
+        For a NumPy array, target may also be an array of queries; they are answered together with a
+        vectorized lower bound and the result is an array of indices (-1 where not found).
+        """
+        if np is not None and isinstance(arr, np.ndarray):
+            return SearchingAlgorithms._numpy_binary_search(arr, target)
         left, right = 0, len(arr) - 1
         while left <= right:
             mid = (left + right) // 2
@@ -33,36 +54,323 @@ class SearchingAlgorithms:
                 right = mid - 1
         return -1  # return -1 if target is not found
 
+    @staticmethod
+    def _numpy_binary_search(arr, target):
+        """Vectorized lower-bound search of one or many targets in a sorted ndarray."""
+        targets = np.asarray(target)
+        if arr.size == 0:
+            result = np.full(targets.shape, -1, dtype=np.intp)
+        else:
+            idx = np.searchsorted(arr, targets, side='left')
+            hit = (idx < arr.size) & (arr[np.minimum(idx, arr.size - 1)] == targets)
+            result = np.where(hit, idx, -1)
+        return int(result) if result.ndim == 0 else result
+
     @staticmethod
     def dfs(graph, start):
         """Performs Depth-First Search (DFS) on a graph starting from a given node."""
-        visited = set()
-        result = []
-
-        def dfs_helper(node):
-            visited.add(node)
-            result.append(node)
-            for neighbor in graph[node]:
-                if neighbor not in visited:
-                    dfs_helper(neighbor)
-
-        dfs_helper(start)
-        return result
+        return list(SearchingAlgorithms.iter_dfs(graph, start))
 
     @staticmethod
     def bfs(graph, start):
         """Performs Breadth-First Search (BFS) on a graph starting from a given node."""
-        visited = set()
-        queue = deque([start])
-        result = []
+        return list(SearchingAlgorithms.iter_bfs(graph, start))
+
+    @staticmethod
+    def _neighbors(graph):
+        """Returns a node -> neighbors accessor for adjacency mappings/lists or graphs with neighbors()."""
+        return getattr(graph, "neighbors", None) or graph.__getitem__
+
+    @staticmethod
+    def iter_dfs(graph, start, depth_limit=None, visit=None):
+        """Lazily yields nodes in depth-first preorder using an explicit stack of neighbor iterators.
 
+        graph[node] may be any iterable of neighbors; objects with a neighbors(node) method (such as
+        a CSR graph) are also accepted. visit(node, depth) is called right after node is yielded (in
+        DFS that is also when it is discovered); returning False from it prunes that node's subtree.
+        Nodes deeper than depth_limit are not expanded; a node first reached along a deeper path is
+        expanded again (but not yielded again) when a shorter path reaches it, so every node within
+        depth_limit edges of start is yielded.
+        """
+        neighbors = SearchingAlgorithms._neighbors(graph)
+        best = {start: 0}  # Shallowest depth at which each node has been reached.
+        yield start
+        if (visit is not None and visit(start, 0) is False) or depth_limit == 0:
+            return
+        stack = [iter(neighbors(start))]
+        while stack:
+            for node in stack[-1]:
+                depth = len(stack)
+                seen = best.get(node)
+                if seen is None:
+                    best[node] = depth
+                    yield node
+                    if visit is not None and visit(node, depth) is False:
+                        best[node] = 0  # A pruned subtree is never re-expanded from a shorter path.
+                        break
+                elif depth_limit is None or depth >= seen:
+                    continue
+                else:
+                    best[node] = depth
+                if depth_limit is None or depth < depth_limit:
+                    stack.append(iter(neighbors(node)))
+                break
+            else:
+                stack.pop()
+
+    @staticmethod
+    def iter_bfs(graph, start, depth_limit=None, visit=None):
+        """Lazily yields nodes in breadth-first order, marking nodes visited when they are enqueued.
+
+        Accepts the same graph types and depth_limit as iter_dfs. visit(node, depth) is also called
+        right after node is yielded, which in BFS is when it is dequeued, not when it is first
+        enqueued; returning False stops that node's neighbors from being enqueued.
+        """
+        neighbors = SearchingAlgorithms._neighbors(graph)
+        visited = {start}
+        queue = deque([(start, 0)])
         while queue:
-            node = queue.popleft()
-            if node not in visited:
-                visited.add(node)
-                result.append(node)
-                queue.extend(graph[node] - visited)
-        return result
+            node, depth = queue.popleft()
+            yield node
+            if visit is not None and visit(node, depth) is False:
+                continue
+            if depth_limit is not None and depth >= depth_limit:
+                continue
+            for neighbor in neighbors(node):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append((neighbor, depth + 1))
+
+    @staticmethod
+    def bidirectional_bfs(graph, source, target, reverse_graph=None):
+        """Returns a shortest unweighted path from source to target, or [] if there is none.
+
+        Searches forward from source and backward from target (over reverse_graph, which defaults to
+        graph for undirected graphs), always expanding the smaller frontier by one full level, and
+        stops as soon as the two searches meet.
+        """
+        if source == target:
+            return [source]
+        forward = SearchingAlgorithms._neighbors(graph)
+        backward = SearchingAlgorithms._neighbors(reverse_graph if reverse_graph is not None else graph)
+        parents_f, parents_b = {source: None}, {target: None}
+        frontier_f, frontier_b = [source], [target]
+        while frontier_f and frontier_b:
+            if len(frontier_f) <= len(frontier_b):
+                frontier, neighbors, parents, other = frontier_f, forward, parents_f, parents_b
+            else:
+                frontier, neighbors, parents, other = frontier_b, backward, parents_b, parents_f
+            next_frontier = []
+            meeting = None
+            for node in frontier:
+                for neighbor in neighbors(node):
+                    if neighbor not in parents:
+                        parents[neighbor] = node
+                        next_frontier.append(neighbor)
+                        if neighbor in other:
+                            meeting = neighbor
+                            break
+                if meeting is not None:
+                    break
+            if meeting is not None:
+                path = []
+                node = meeting
+                while node is not None:
+                    path.append(node)
+                    node = parents_f[node]
+                path.reverse()
+                node = parents_b[meeting]
+                while node is not None:
+                    path.append(node)
+                    node = parents_b[node]
+                return path
+            if frontier is frontier_f:
+                frontier_f = next_frontier
+            else:
+                frontier_b = next_frontier
+        return []
+
+    @staticmethod
+    def multi_source_bfs(graph, sources, num_nodes=None, reverse_graph=None, direction_optimizing=False):
+        """Computes BFS distances and parents from the nearest of several sources in one pass.
+
+        With num_nodes set, nodes must be integers 0..num_nodes-1 and the result is a pair of
+        array('l') (distance and parent, -1 where unreached / for sources); otherwise two dicts.
+        direction_optimizing switches between top-down and bottom-up levels (Beamer et al.), which
+        requires num_nodes, sized adjacency lists and reverse_graph for directed graphs.
+        """
+        neighbors = SearchingAlgorithms._neighbors(graph)
+        if num_nodes is None:
+            if direction_optimizing:
+                raise ValueError("direction_optimizing requires integer node ids and num_nodes.")
+            dist, parent = {}, {}
+            for s in sources:
+                dist[s], parent[s] = 0, None
+            queue = deque(dist)
+            while queue:
+                node = queue.popleft()
+                for neighbor in neighbors(node):
+                    if neighbor not in dist:
+                        dist[neighbor] = dist[node] + 1
+                        parent[neighbor] = node
+                        queue.append(neighbor)
+            return dist, parent
+
+        dist = array.array('l', [-1]) * num_nodes
+        parent = array.array('l', [-1]) * num_nodes
+        frontier = []
+        for s in sources:
+            if dist[s] == -1:
+                dist[s] = 0
+                frontier.append(s)
+        in_neighbors = SearchingAlgorithms._neighbors(reverse_graph if reverse_graph is not None else graph)
+        alpha, beta = 14, 24
+        unexplored_edges = sum(len(neighbors(v)) for v in range(num_nodes)) if direction_optimizing else 0
+        bottom_up = False
+        level = 0
+        while frontier:
+            level += 1
+            next_frontier = []
+            if bottom_up:
+                in_frontier = bytearray(num_nodes)
+                for node in frontier:
+                    in_frontier[node] = 1
+                for v in range(num_nodes):
+                    if dist[v] == -1:
+                        for u in in_neighbors(v):
+                            if in_frontier[u]:
+                                dist[v] = level
+                                parent[v] = u
+                                next_frontier.append(v)
+                                break
+            else:
+                for u in frontier:
+                    for v in neighbors(u):
+                        if dist[v] == -1:
+                            dist[v] = level
+                            parent[v] = u
+                            next_frontier.append(v)
+            frontier = next_frontier
+            if direction_optimizing:
+                frontier_edges = sum(len(neighbors(v)) for v in frontier)
+                unexplored_edges -= frontier_edges
+                if not bottom_up and frontier_edges > unexplored_edges / alpha:
+                    bottom_up = True
+                elif bottom_up and len(frontier) < num_nodes / beta:
+                    bottom_up = False
+        return dist, parent
+
+    class SortedIndex:
+        def __init__(self, arr, presorted=False, eytzinger=False):
+            """Reusable search index over a sorted copy of arr, optionally in Eytzinger (BFS) layout."""
+            self.keys = list(arr) if presorted else sorted(arr)
+            self.n = len(self.keys)
+            self.eytzinger = eytzinger
+            if eytzinger:
+                # eyt[1..n] holds the keys in BFS order of an implicit complete search tree;
+                # rank[k] is the sorted position of the key stored in slot k.
+                self.eyt = [None] * (self.n + 1)
+                self.rank = [0] * (self.n + 1)
+                stack, k, i = [], 1, 0
+                while stack or k <= self.n:
+                    while k <= self.n:
+                        stack.append(k)
+                        k *= 2
+                    k = stack.pop()
+                    self.eyt[k] = self.keys[i]
+                    self.rank[k] = i
+                    i += 1
+                    k = 2 * k + 1
+
+        def _eytzinger_bound(self, x, upper):
+            eyt, n, k = self.eyt, self.n, 1
+            if upper:
+                while k <= n:
+                    k = 2 * k + (eyt[k] <= x)
+            else:
+                while k <= n:
+                    k = 2 * k + (eyt[k] < x)
+            # Drop the trailing right turns plus the final left turn to find the answer slot.
+            k >>= (~k & (k + 1)).bit_length()
+            return self.rank[k] if k else n
+
+        def lower_bound(self, x):
+            """Returns the first position whose key is not less than x."""
+            if self.eytzinger:
+                return self._eytzinger_bound(x, False)
+            return bisect.bisect_left(self.keys, x)
+
+        def upper_bound(self, x):
+            """Returns the first position whose key is greater than x."""
+            if self.eytzinger:
+                return self._eytzinger_bound(x, True)
+            return bisect.bisect_right(self.keys, x)
+
+        def equal_range(self, x):
+            """Returns (lower_bound(x), upper_bound(x)), the slice of keys equal to x."""
+            return self.lower_bound(x), self.upper_bound(x)
+
+        def search(self, x):
+            """Returns the position of x in the sorted keys, or -1 if it is absent."""
+            i = self.lower_bound(x)
+            return i if i < self.n and self.keys[i] == x else -1
+
+        def lower_bound_many(self, queries, sorted_queries=False):
+            """Returns lower_bound for every query, in query order.
+
+            Queries are answered in ascending order with a merge-style sweep: each search gallops
+            forward from the previous answer, so q sorted queries cost O(q log(n / q)).
+            """
+            queries = list(queries)
+            if sorted_queries:
+                order = range(len(queries))
+            else:
+                order = sorted(range(len(queries)), key=queries.__getitem__)
+            keys, n = self.keys, self.n
+            result = [0] * len(queries)
+            pos = 0
+            for qi in order:
+                x = queries[qi]
+                step = 1
+                hi = pos
+                while hi < n and keys[hi] < x:
+                    pos = hi + 1
+                    hi = pos + step
+                    step *= 2
+                pos = bisect.bisect_left(keys, x, pos, min(hi, n))
+                result[qi] = pos
+            return result
+
+        def search_many(self, queries, sorted_queries=False):
+            """Returns the position of every query in the sorted keys (-1 where absent)."""
+            queries = list(queries)
+            keys, n = self.keys, self.n
+            return [i if i < n and keys[i] == x else -1
+                    for i, x in zip(self.lower_bound_many(queries, sorted_queries), queries)]
+
+    @staticmethod
+    def benchmark(n=200000, q=50000):
+        """Times per-query binary_search against the SortedIndex lookups."""
+        def timed(fn):
+            start = time.perf_counter()
+            fn()
+            return time.perf_counter() - start
+
+        arr = sorted(random.sample(range(4 * n), n))
+        queries = [random.randrange(4 * n) for _ in range(q)]
+        sorted_queries = sorted(queries)
+        plain = SearchingAlgorithms.SortedIndex(arr, presorted=True)
+        eyt = SearchingAlgorithms.SortedIndex(arr, presorted=True, eytzinger=True)
+        baseline = timed(lambda: [SearchingAlgorithms.binary_search(arr, x) for x in queries])
+        results = [
+            ("SortedIndex.search", timed(lambda: [plain.search(x) for x in queries])),
+            ("SortedIndex.search (Eytzinger)", timed(lambda: [eyt.search(x) for x in queries])),
+            ("search_many (unsorted queries)", timed(lambda: plain.search_many(queries))),
+            ("search_many (sorted queries)", timed(lambda: plain.search_many(sorted_queries, sorted_queries=True))),
+        ]
+        print(f"Binary search benchmark (n={n}, queries={q}, binary_search: {baseline:.4f}s):")
+        for name, elapsed in results:
+            print(f"  {name:<32} {elapsed:.4f}s  speedup: {baseline / elapsed:.1f}x")
     
     @staticmethod
     def main():
@@ -75,6 +383,17 @@ class SearchingAlgorithms:
         sorted_arr = [10, 20, 30, 40, 50, 60]
         print("Binary Search:", SearchingAlgorithms.binary_search(sorted_arr, target))
 
+        # Testing the Sorted Index
+        index = SearchingAlgorithms.SortedIndex([10, 20, 20, 20, 40, 50], presorted=True, eytzinger=True)
+        print("Sorted Index equal_range(20):", index.equal_range(20))
+        print("Sorted Index search_many:", index.search_many([50, 15, 10, 40]))
+
+        # Testing the NumPy backend (only when NumPy is installed)
+        if np is not None:
+            np_arr = np.array(sorted_arr)
+            print("Linear Search (NumPy):", SearchingAlgorithms.linear_search(np_arr, target))
+            print("Binary Search (NumPy, batched):", SearchingAlgorithms.binary_search(np_arr, np.array([10, 35, 60])))
+
         # Testing Depth-First Search (DFS)
         graph = {
             'A': {'B', 'C'},
@@ -89,6 +408,19 @@ class SearchingAlgorithms:
         # Testing Breadth-First Search (BFS)
         print("BFS:", SearchingAlgorithms.bfs(graph, 'A'))
 
+        # Testing the lazy traversals on a path far longer than the recursion limit
+        path = [[i + 1] for i in range(100000)] + [[]]
+        print("Iterative DFS depth:", sum(1 for _ in SearchingAlgorithms.iter_dfs(path, 0)) - 1)
+        shortcut = {0: [1, 3], 1: [2], 2: [3], 3: [4], 4: []}
+        print("DFS (depth_limit=3, shorter path found later):", list(SearchingAlgorithms.iter_dfs(shortcut, 0, depth_limit=3)))
+        print("BFS (depth_limit=1):", list(SearchingAlgorithms.iter_bfs(graph, 'A', depth_limit=1)))
+
+        # Testing Bidirectional and Multi-Source BFS
+        print("Bidirectional BFS (A -> F):", SearchingAlgorithms.bidirectional_bfs(graph, 'A', 'F'))
+        grid = [[1, 3], [0, 2, 4], [1, 5], [0, 4], [1, 3, 5], [2, 4]]  # 2x3 grid graph
+        dist, parent = SearchingAlgorithms.multi_source_bfs(grid, [0, 5], num_nodes=6, direction_optimizing=True)
+        print("Multi-Source BFS distances:", list(dist), "parents:", list(parent))
+
 
 # Main function to test the searching and graph traversal algorithms
 if __name__ == "__main__":
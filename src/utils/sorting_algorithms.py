@@ -1,5 +1,22 @@
 # sorting_algorithms.py
 
+import array
+import bisect
+import heapq
+import mmap
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python paths are used without it.
+    np = None
+
 class SortingAlgorithms:
     """
     ### Sorting Algorithms:
@@ -10,7 +27,18 @@ class SortingAlgorithms:
     5. Quick Sort
     6. Heap Sort
     7. Radix Sort
+    8. Tim Sort (Adaptive Hybrid Merge Sort)
+    9. External Merge Sort
+    10. Parallel Sample Sort
+    11. Intro Sort
+    12. LSD / MSD Radix Sort (byte-wise)
+    13. Counting Sort
+    14. Selection / Top-K (Introselect, nsmallest, nlargest)
     """
+
+    INSERTION_SORT_CUTOFF = 16
+    MIN_MERGE = 32
+    MIN_GALLOP = 7
     
     @staticmethod
     def bubble_sort(arr):
@@ -80,14 +108,8 @@ class SortingAlgorithms:
 
     @staticmethod
     def quick_sort(arr):
-        """Sorts an array using the Quick Sort algorithm."""
-        if len(arr) <= 1:
-            return arr
-        pivot = arr[len(arr) // 2]
-        left = [x for x in arr if x < pivot]
-        middle = [x for x in arr if x == pivot]
-        right = [x for x in arr if x > pivot]
-        return SortingAlgorithms.quick_sort(left) + middle + SortingAlgorithms.quick_sort(right)
+        """Sorts an array in place using the Quick Sort algorithm (bounded by introsort)."""
+        return SortingAlgorithms.intro_sort(arr)
 
     @staticmethod
     def heap_sort(arr):
@@ -115,30 +137,850 @@ class SortingAlgorithms:
     @staticmethod
     def radix_sort(arr):
         """Sorts an array using the Radix Sort algorithm."""
-        def counting_sort(arr, exp):
-            n = len(arr)
-            output = [0] * n
-            count = [0] * 10
-            for i in range(n):
-                index = arr[i] // exp
-                count[index % 10] += 1
-            for i in range(1, 10):
-                count[i] += count[i-1]
-            i = n - 1
-            while i >= 0:
-                index = arr[i] // exp
-                output[count[index % 10] - 1] = arr[i]
-                count[index % 10] -= 1
+        return SortingAlgorithms.lsd_radix_sort(arr)
+
+    @staticmethod
+    def tim_sort(arr, key=None, reverse=False):
+        """Sorts an array in place using an adaptive, run-detecting hybrid merge sort (Timsort)."""
+        n = len(arr)
+        if n < 2:
+            return arr
+        if not isinstance(arr, list):
+            # Merges slice-assign list scratch, so sort a list copy and write it back into the caller's sequence.
+            result = SortingAlgorithms.tim_sort(list(arr), key, reverse)
+            arr[:] = type(arr)(arr.typecode, result) if isinstance(arr, array.array) else result
+            return arr
+        if reverse:
+            # Reversing before and after a stable ascending sort keeps equal items in order.
+            arr.reverse()
+        keys = arr if key is None else [key(x) for x in arr]
+        vals = None if key is None else arr
+
+        # Single scratch buffer reused by every merge; a merge never needs more than n // 2 slots.
+        scratch_k = [None] * (n // 2 + 1)
+        scratch_v = None if vals is None else [None] * (n // 2 + 1)
+        min_gallop = SortingAlgorithms.MIN_GALLOP
+
+        def min_run_length(n):
+            r = 0
+            while n >= SortingAlgorithms.MIN_MERGE:
+                r |= n & 1
+                n >>= 1
+            return n + r
+
+        def gallop(x, seq, lo, hi, right, from_end):
+            """Exponential search for the insertion point of x in seq[lo:hi], then bisect."""
+            a, b = lo, hi
+            ofs = 1
+            if from_end:
+                while hi - ofs >= lo:
+                    p = hi - ofs
+                    if (seq[p] <= x) if right else (seq[p] < x):
+                        a = p + 1
+                        break
+                    b = p
+                    ofs <<= 1
+            else:
+                while lo + ofs - 1 < hi:
+                    p = lo + ofs - 1
+                    if (seq[p] <= x) if right else (seq[p] < x):
+                        a = p + 1
+                        ofs <<= 1
+                    else:
+                        b = p
+                        break
+            if right:
+                return bisect.bisect_right(seq, x, a, b)
+            return bisect.bisect_left(seq, x, a, b)
+
+        def count_run(lo):
+            """Returns the length of the natural run starting at lo, reversing strictly descending runs."""
+            hi = lo + 1
+            if hi == n:
+                return 1
+            if keys[hi] < keys[lo]:
+                while hi < n and keys[hi] < keys[hi - 1]:
+                    hi += 1
+                keys[lo:hi] = keys[lo:hi][::-1]
+                if vals is not None:
+                    vals[lo:hi] = vals[lo:hi][::-1]
+            else:
+                while hi < n and not keys[hi] < keys[hi - 1]:
+                    hi += 1
+            return hi - lo
+
+        def binary_insertion_sort(lo, hi, start):
+            """Extends the sorted prefix keys[lo:start] to keys[lo:hi]."""
+            for i in range(start, hi):
+                x = keys[i]
+                pos = bisect.bisect_right(keys, x, lo, i)
+                if pos != i:
+                    keys[pos + 1:i + 1] = keys[pos:i]
+                    keys[pos] = x
+                    if vals is not None:
+                        v = vals[i]
+                        vals[pos + 1:i + 1] = vals[pos:i]
+                        vals[pos] = v
+
+        def merge_lo(base_a, len_a, base_b, len_b):
+            """Merges adjacent runs left to right; run A (the shorter one) is moved to scratch."""
+            nonlocal min_gallop
+            scratch_k[:len_a] = keys[base_a:base_b]
+            if vals is not None:
+                scratch_v[:len_a] = vals[base_a:base_b]
+            i, j, dest, end_b = 0, base_b, base_a, base_b + len_b
+            while i < len_a and j < end_b:
+                count_a = count_b = 0
+                while i < len_a and j < end_b:
+                    if keys[j] < scratch_k[i]:
+                        keys[dest] = keys[j]
+                        if vals is not None:
+                            vals[dest] = vals[j]
+                        j += 1
+                        count_b += 1
+                        count_a = 0
+                    else:
+                        keys[dest] = scratch_k[i]
+                        if vals is not None:
+                            vals[dest] = scratch_v[i]
+                        i += 1
+                        count_a += 1
+                        count_b = 0
+                    dest += 1
+                    if count_a >= min_gallop or count_b >= min_gallop:
+                        break
+                while i < len_a and j < end_b:
+                    k = gallop(keys[j], scratch_k, i, len_a, True, False) - i
+                    if k:
+                        keys[dest:dest + k] = scratch_k[i:i + k]
+                        if vals is not None:
+                            vals[dest:dest + k] = scratch_v[i:i + k]
+                        dest += k
+                        i += k
+                        if i == len_a:
+                            break
+                    k2 = gallop(scratch_k[i], keys, j, end_b, False, False) - j
+                    if k2:
+                        keys[dest:dest + k2] = keys[j:j + k2]
+                        if vals is not None:
+                            vals[dest:dest + k2] = vals[j:j + k2]
+                        dest += k2
+                        j += k2
+                    if k < SortingAlgorithms.MIN_GALLOP and k2 < SortingAlgorithms.MIN_GALLOP:
+                        min_gallop += 1
+                        break
+                    min_gallop = max(1, min_gallop - 1)
+            if i < len_a:
+                keys[dest:dest + len_a - i] = scratch_k[i:len_a]
+                if vals is not None:
+                    vals[dest:dest + len_a - i] = scratch_v[i:len_a]
+
+        def merge_hi(base_a, len_a, base_b, len_b):
+            """Merges adjacent runs right to left; run B (the shorter one) is moved to scratch."""
+            nonlocal min_gallop
+            scratch_k[:len_b] = keys[base_b:base_b + len_b]
+            if vals is not None:
+                scratch_v[:len_b] = vals[base_b:base_b + len_b]
+            i, j, dest = len_b - 1, base_b - 1, base_b + len_b - 1
+            while i >= 0 and j >= base_a:
+                count_a = count_b = 0
+                while i >= 0 and j >= base_a:
+                    if scratch_k[i] < keys[j]:
+                        keys[dest] = keys[j]
+                        if vals is not None:
+                            vals[dest] = vals[j]
+                        j -= 1
+                        count_a += 1
+                        count_b = 0
+                    else:
+                        keys[dest] = scratch_k[i]
+                        if vals is not None:
+                            vals[dest] = scratch_v[i]
+                        i -= 1
+                        count_b += 1
+                        count_a = 0
+                    dest -= 1
+                    if count_a >= min_gallop or count_b >= min_gallop:
+                        break
+                while i >= 0 and j >= base_a:
+                    p = gallop(scratch_k[i], keys, base_a, j + 1, True, True)
+                    k = j + 1 - p
+                    if k:
+                        keys[dest - k + 1:dest + 1] = keys[p:j + 1]
+                        if vals is not None:
+                            vals[dest - k + 1:dest + 1] = vals[p:j + 1]
+                        dest -= k
+                        j = p - 1
+                        if j < base_a:
+                            break
+                    p = gallop(keys[j], scratch_k, 0, i + 1, False, True)
+                    k2 = i + 1 - p
+                    if k2:
+                        keys[dest - k2 + 1:dest + 1] = scratch_k[p:i + 1]
+                        if vals is not None:
+                            vals[dest - k2 + 1:dest + 1] = scratch_v[p:i + 1]
+                        dest -= k2
+                        i = p - 1
+                    if k < SortingAlgorithms.MIN_GALLOP and k2 < SortingAlgorithms.MIN_GALLOP:
+                        min_gallop += 1
+                        break
+                    min_gallop = max(1, min_gallop - 1)
+            if i >= 0:
+                keys[base_a:base_a + i + 1] = scratch_k[:i + 1]
+                if vals is not None:
+                    vals[base_a:base_a + i + 1] = scratch_v[:i + 1]
+
+        def merge_at(runs, idx):
+            base_a, len_a = runs[idx]
+            base_b, len_b = runs[idx + 1]
+            runs[idx] = (base_a, len_a + len_b)
+            del runs[idx + 1]
+            # Elements of A already <= B[0], and of B already >= A[-1], are in their final place.
+            start = gallop(keys[base_b], keys, base_a, base_b, True, False)
+            len_a -= start - base_a
+            base_a = start
+            if len_a == 0:
+                return
+            len_b = gallop(keys[base_b - 1], keys, base_b, base_b + len_b, False, True) - base_b
+            if len_b == 0:
+                return
+            if len_a <= len_b:
+                merge_lo(base_a, len_a, base_b, len_b)
+            else:
+                merge_hi(base_a, len_a, base_b, len_b)
+
+        def merge_collapse(runs):
+            while len(runs) > 1:
+                i = len(runs) - 2
+                if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or \
+                        (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+                    if runs[i - 1][1] < runs[i + 1][1]:
+                        i -= 1
+                elif runs[i][1] > runs[i + 1][1]:
+                    break
+                merge_at(runs, i)
+
+        min_run = min_run_length(n)
+        runs = []  # stack of (start, length) pending runs
+        lo = 0
+        while lo < n:
+            run_len = count_run(lo)
+            if run_len < min_run:
+                forced = min(min_run, n - lo)
+                binary_insertion_sort(lo, lo + forced, lo + run_len)
+                run_len = forced
+            runs.append((lo, run_len))
+            merge_collapse(runs)
+            lo += run_len
+
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
                 i -= 1
-            for i in range(n):
-                arr[i] = output[i]
-
-        max_val = max(arr)
-        exp = 1
-        while max_val // exp > 0:
-            counting_sort(arr, exp)
-            exp *= 10
+            merge_at(runs, i)
+
+        if reverse:
+            arr.reverse()
+        return arr
+
+    @staticmethod
+    def external_sort(input_path, output_path, memory_limit=64 * 1024 * 1024, typecode=None, temp_dir=None):
+        """Sorts a file larger than RAM with an external k-way merge sort.
+
+        With typecode=None the file is treated as newline-delimited byte records; otherwise it is
+        read as fixed-width binary numbers of that array typecode (e.g. 'q' for int64).
+        memory_limit bounds the estimated memory of each chunk sorted at once, counting the Python
+        object and list slot every record occupies while it is sorted, not just its raw bytes.
+        """
+        itemsize = array.array(typecode).itemsize if typecode else 1
+        if typecode:
+            # Raw bytes plus their array copy while loading, then a boxed number and its list slot.
+            largest = 0.0 if typecode in "fd" else 1 << (8 * itemsize)
+            record_cost = 2 * itemsize + sys.getsizeof(largest) + 8
+            chunk_size = max(1, memory_limit // record_cost) * itemsize
+        else:
+            # The input window and the lines split from it coexist; each line also becomes a bytes
+            # object with its own list slot and half a merge-scratch slot.
+            line_overhead = sys.getsizeof(b"") + 12
+            chunk_size = max(1, memory_limit // 2)
+        run_paths = []
+
+        def spill(records):
+            """Sorts one chunk in memory and writes it to a temporary run file."""
+            SortingAlgorithms.tim_sort(records)
+            fd, path = tempfile.mkstemp(suffix=".run", dir=temp_dir)
+            with os.fdopen(fd, "wb", buffering=1024 * 1024) as f:
+                if typecode:
+                    array.array(typecode, records).tofile(f)
+                else:
+                    f.writelines(records)
+            run_paths.append(path)
+
+        def read_run(path, buffer_size):
+            """Streams records back from a run file in buffered blocks."""
+            with open(path, "rb", buffering=buffer_size) as f:
+                if not typecode:
+                    yield from f
+                    return
+                count = max(1, buffer_size // itemsize)
+                while True:
+                    block = array.array(typecode)
+                    try:
+                        block.fromfile(f, count)
+                    except EOFError:
+                        yield from block
+                        return
+                    yield from block
+
+        try:
+            # 1. Stream the memory-mapped input in chunks and spill each sorted chunk as a run.
+            size = os.path.getsize(input_path)
+            if size % itemsize:
+                raise ValueError(f"File size {size} is not a multiple of the record size {itemsize}.")
+            if size:
+                with open(input_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    start = 0
+                    while start < size:
+                        end = min(start + chunk_size, size)
+                        if typecode:
+                            spill(array.array(typecode, mm[start:end]).tolist())
+                        else:
+                            if end < size:
+                                newline = mm.rfind(b"\n", start, end)
+                                end = newline + 1 if newline != -1 else (mm.find(b"\n", end) + 1 or size)
+                            window = mm[start:end]
+                            # Short lines cost far more as objects than as input bytes; shrink the chunk to fit.
+                            while True:
+                                cost = 2 * len(window) + window.count(b"\n") * line_overhead
+                                newline = mm.rfind(b"\n", start, start + len(window) * memory_limit // cost)
+                                if cost <= memory_limit or newline == -1:
+                                    break
+                                end = newline + 1
+                                window = mm[start:end]
+                            records = window.splitlines(keepends=True)
+                            del window
+                            if not records[-1].endswith(b"\n"):
+                                records[-1] += b"\n"
+                            spill(records)
+                            del records  # Release this chunk before the next window is read.
+                        start = end
+
+            # 2. Heap-based k-way merge of all runs, streamed straight to the output file.
+            buffer_size = max(64 * 1024, memory_limit // (len(run_paths) + 1))
+            with open(output_path, "wb", buffering=buffer_size) as out:
+                merged = heapq.merge(*(read_run(path, buffer_size) for path in run_paths))
+                if typecode:
+                    count = max(1, buffer_size // itemsize)
+                    block = array.array(typecode)
+                    for value in merged:
+                        block.append(value)
+                        if len(block) >= count:
+                            block.tofile(out)
+                            block = array.array(typecode)
+                    block.tofile(out)
+                else:
+                    out.writelines(merged)
+        finally:
+            for path in run_paths:
+                os.remove(path)
+        return output_path
+
+    @staticmethod
+    def _parallel_sort_block(shm_name, typecode, lo, hi):
+        """Worker: sorts view[lo:hi] of the shared buffer in place."""
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            with shm.buf.cast('B').cast(typecode) as view:
+                view[lo:hi] = array.array(typecode, SortingAlgorithms.tim_sort(view[lo:hi].tolist()))
+        finally:
+            shm.close()
+
+    @staticmethod
+    def _parallel_merge_bucket(in_name, out_name, typecode, ranges, offset):
+        """Worker: merges the sorted sub-ranges of one bucket into the output buffer at offset."""
+        shm_in = shared_memory.SharedMemory(name=in_name)
+        shm_out = shared_memory.SharedMemory(name=out_name)
+        try:
+            with shm_in.buf.cast('B').cast(typecode) as src, shm_out.buf.cast('B').cast(typecode) as dst:
+                bucket = []
+                for lo, hi in ranges:
+                    bucket.extend(src[lo:hi].tolist())
+                # The bucket is a concatenation of sorted runs, which tim_sort merges directly.
+                SortingAlgorithms.tim_sort(bucket)
+                dst[offset:offset + len(bucket)] = array.array(typecode, bucket)
+        finally:
+            shm_in.close()
+            shm_out.close()
+
+    @staticmethod
+    def parallel_sort(arr, workers=None, typecode=None, min_parallel_size=10000):
+        """Sorts a numeric array in place with a multi-process sample sort over shared memory.
+
+        Uses parallel sorting by regular sampling: workers sort contiguous blocks of a shared
+        buffer, splitters are chosen from regular samples of the sorted blocks, and each worker
+        merges one bucket straight into its final slot of a shared output buffer. typecode defaults
+        to arr's own for array.array input and to 'q' otherwise; float data needs typecode='d'.
+        """
+        n = len(arr)
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or n < max(min_parallel_size, workers):
+            if isinstance(arr, list):
+                return SortingAlgorithms.tim_sort(arr)
+            result = SortingAlgorithms.tim_sort(list(arr))
+            arr[:] = type(arr)(arr.typecode, result) if isinstance(arr, array.array) else result
+            return arr
+
+        if typecode is None:
+            typecode = arr.typecode if isinstance(arr, array.array) else 'q'
+        # Converting up front rejects values that don't fit typecode before any shared memory exists.
+        data = array.array(typecode, arr)
+        shm_in = shared_memory.SharedMemory(create=True, size=n * data.itemsize)
+        try:
+            shm_out = shared_memory.SharedMemory(create=True, size=n * data.itemsize)
+        except BaseException:
+            shm_in.close()
+            shm_in.unlink()
+            raise
+        try:
+            with shm_in.buf.cast('B').cast(typecode) as src:
+                src[:] = data
+                bounds = [n * i // workers for i in range(workers + 1)]
+                blocks = list(zip(bounds, bounds[1:]))
+                with multiprocessing.Pool(workers) as pool:
+                    pool.starmap(SortingAlgorithms._parallel_sort_block,
+                                 [(shm_in.name, typecode, lo, hi) for lo, hi in blocks])
+
+                    samples = []
+                    for lo, hi in blocks:
+                        step = max(1, (hi - lo) // workers)
+                        samples.extend(src[i] for i in range(lo, hi, step))
+                    samples.sort()
+                    splitters = [samples[len(samples) * i // workers] for i in range(1, workers)]
+
+                    # cuts[b][j] is where bucket j starts inside sorted block b.
+                    cuts = [[lo] + [bisect.bisect_right(src, x, lo, hi) for x in splitters] + [hi]
+                            for lo, hi in blocks]
+                    tasks = []
+                    offset = 0
+                    for j in range(workers):
+                        ranges = [(cut[j], cut[j + 1]) for cut in cuts]
+                        tasks.append((shm_in.name, shm_out.name, typecode, ranges, offset))
+                        offset += sum(hi - lo for lo, hi in ranges)
+                    pool.starmap(SortingAlgorithms._parallel_merge_bucket, tasks)
+
+            with shm_out.buf.cast('B').cast(typecode) as dst:
+                data = array.array(typecode, dst)
+            if isinstance(arr, array.array):
+                arr[:] = data if arr.typecode == typecode else array.array(arr.typecode, data)
+            else:
+                arr[:] = data.tolist()
+        finally:
+            shm_in.close()
+            shm_in.unlink()
+            shm_out.close()
+            shm_out.unlink()
+        return arr
+
+    @staticmethod
+    def _swap(keys, vals, i, j):
+        keys[i], keys[j] = keys[j], keys[i]
+        if vals is not None:
+            vals[i], vals[j] = vals[j], vals[i]
+
+    @staticmethod
+    def _choose_pivot(keys, lo, hi):
+        """Returns the index of a median-of-three pivot for keys[lo:hi], or Tukey's ninther for large ranges."""
+        def median_of_three(i, j, k):
+            a, b, c = keys[i], keys[j], keys[k]
+            if a < b:
+                return j if b < c else (k if a < c else i)
+            return i if a < c else (k if b < c else j)
+
+        n = hi - lo
+        mid = lo + n // 2
+        if n < 128:
+            return median_of_three(lo, mid, hi - 1)
+        step = n // 8
+        return median_of_three(median_of_three(lo, lo + step, lo + 2 * step),
+                               median_of_three(mid - step, mid, mid + step),
+                               median_of_three(hi - 1 - 2 * step, hi - 1 - step, hi - 1))
+
+    @staticmethod
+    def _partition3(keys, vals, lo, hi, pivot_index):
+        """Three-way (Dutch national flag) partition of keys[lo:hi] around keys[pivot_index].
+
+        Returns (lt, gt) such that keys[lo:lt] < pivot, keys[lt:gt] == pivot and keys[gt:hi] > pivot.
+        """
+        swap = SortingAlgorithms._swap
+        pivot = keys[pivot_index]
+        lt, i, gt = lo, lo, hi - 1
+        while i <= gt:
+            x = keys[i]
+            if x < pivot:
+                swap(keys, vals, lt, i)
+                lt += 1
+                i += 1
+            elif pivot < x:
+                swap(keys, vals, i, gt)
+                gt -= 1
+            else:
+                i += 1
+        return lt, gt + 1
+
+    @staticmethod
+    def _sift_down(keys, vals, root, lo, hi, cmp):
+        """Restores the heap property for the heap stored in keys[lo:hi] below node root.
+
+        cmp(a, b) returns True when a belongs closer to the top of the heap than b.
+        """
+        while True:
+            child = lo + 2 * (root - lo) + 1
+            if child >= hi:
+                return
+            if child + 1 < hi and cmp(keys[child + 1], keys[child]):
+                child += 1
+            if not cmp(keys[child], keys[root]):
+                return
+            SortingAlgorithms._swap(keys, vals, root, child)
+            root = child
+
+    @staticmethod
+    def _sift_up(keys, vals, pos, lo, cmp):
+        """Moves node pos of the heap stored from keys[lo] up until its parent outranks it."""
+        while pos > lo:
+            parent = lo + (pos - lo - 1) // 2
+            if not cmp(keys[pos], keys[parent]):
+                return
+            SortingAlgorithms._swap(keys, vals, pos, parent)
+            pos = parent
+
+    @staticmethod
+    def _heap_sort_range(keys, vals, lo, hi, cmp=None):
+        """Sorts keys[lo:hi] in place with an iterative heap sort.
+
+        The default max-heap gives ascending order; passing cmp=less (a min-heap) gives descending order.
+        """
+        cmp = cmp or (lambda a, b: b < a)
+        for root in range(lo + (hi - lo) // 2 - 1, lo - 1, -1):
+            SortingAlgorithms._sift_down(keys, vals, root, lo, hi, cmp)
+        for end in range(hi - 1, lo, -1):
+            SortingAlgorithms._swap(keys, vals, lo, end)
+            SortingAlgorithms._sift_down(keys, vals, lo, lo, end, cmp)
+
+    @staticmethod
+    def _insertion_sort_range(keys, vals, lo, hi):
+        """Sorts keys[lo:hi] in place with insertion sort."""
+        for i in range(lo + 1, hi):
+            x = keys[i]
+            v = vals[i] if vals is not None else None
+            j = i - 1
+            while j >= lo and x < keys[j]:
+                keys[j + 1] = keys[j]
+                if vals is not None:
+                    vals[j + 1] = vals[j]
+                j -= 1
+            keys[j + 1] = x
+            if vals is not None:
+                vals[j + 1] = v
+
+    @staticmethod
+    def intro_sort(arr, lo=0, hi=None, key=None):
+        """Sorts arr[lo:hi] in place using introsort.
+
+        Quick sort with ninther pivots and three-way partitioning, falling back to heap sort past
+        2*log2(n) levels and to insertion sort below INSERTION_SORT_CUTOFF elements.
+        """
+        if hi is None:
+            hi = len(arr)
+        if hi - lo < 2:
+            return arr
+        if key is None:
+            keys, vals, a, b = arr, None, lo, hi
+        else:
+            keys, vals, a, b = [key(x) for x in arr[lo:hi]], arr[lo:hi], 0, hi - lo
+
+        def sort_range(a, b, depth):
+            while b - a > SortingAlgorithms.INSERTION_SORT_CUTOFF:
+                if depth == 0:
+                    SortingAlgorithms._heap_sort_range(keys, vals, a, b)
+                    return
+                depth -= 1
+                pivot = SortingAlgorithms._choose_pivot(keys, a, b)
+                lt, gt = SortingAlgorithms._partition3(keys, vals, a, b, pivot)
+                # Recurse into the smaller side and loop on the larger one to bound the stack.
+                if lt - a < b - gt:
+                    sort_range(a, lt, depth)
+                    a = gt
+                else:
+                    sort_range(gt, b, depth)
+                    b = lt
+            SortingAlgorithms._insertion_sort_range(keys, vals, a, b)
+
+        sort_range(a, b, 2 * ((b - a).bit_length() - 1))
+        if vals is not None:
+            arr[lo:hi] = vals
         return arr
+
+    @staticmethod
+    def _median_of_medians(keys, vals, lo, hi):
+        """Returns the index of a median-of-medians pivot for keys[lo:hi] (groups of five)."""
+        groups = 0
+        for start in range(lo, hi, 5):
+            end = min(start + 5, hi)
+            SortingAlgorithms._insertion_sort_range(keys, vals, start, end)
+            SortingAlgorithms._swap(keys, vals, lo + groups, (start + end - 1) // 2)
+            groups += 1
+        mid = lo + groups // 2
+        SortingAlgorithms._select(keys, vals, lo, lo + groups, mid)
+        return mid
+
+    @staticmethod
+    def _select(keys, vals, lo, hi, k):
+        """Introselect: rearranges keys[lo:hi] so that keys[k] is in its sorted position."""
+        depth = 2 * ((hi - lo).bit_length() - 1)
+        while hi - lo > SortingAlgorithms.INSERTION_SORT_CUTOFF:
+            if depth == 0:
+                pivot = SortingAlgorithms._median_of_medians(keys, vals, lo, hi)
+            else:
+                depth -= 1
+                pivot = SortingAlgorithms._choose_pivot(keys, lo, hi)
+            lt, gt = SortingAlgorithms._partition3(keys, vals, lo, hi, pivot)
+            if k < lt:
+                hi = lt
+            elif k >= gt:
+                lo = gt
+            else:
+                return
+        SortingAlgorithms._insertion_sort_range(keys, vals, lo, hi)
+
+    @staticmethod
+    def quick_select(arr, k, lo=0, hi=None, key=None):
+        """Returns the k-th smallest item (0-based index k) of arr[lo:hi] in expected linear time.
+
+        arr[lo:hi] is partially sorted in place: arr[k] ends up in its sorted position, with no larger
+        item before it and no smaller item after it. Falls back to median-of-medians pivots when the
+        partitioning degrades, so the worst case is also linear.
+        """
+        if hi is None:
+            hi = len(arr)
+        if not lo <= k < hi:
+            raise IndexError("k is outside the range [lo, hi).")
+        if key is None:
+            SortingAlgorithms._select(arr, None, lo, hi, k)
+        else:
+            keys, vals = [key(x) for x in arr[lo:hi]], arr[lo:hi]
+            SortingAlgorithms._select(keys, vals, 0, hi - lo, k - lo)
+            arr[lo:hi] = vals
+        return arr[k]
+
+    class TopK:
+        def __init__(self, k, key=None, largest=False):
+            """Streaming top-k accumulator that keeps only k items in a bounded heap; k < 0 keeps none."""
+            self.k = max(k, 0)
+            self.key = key
+            self.largest = largest
+            self.count = 0
+            self.keys = []
+            self.vals = []
+            # The root of the heap is the kept item that the next better item would evict.
+            if largest:
+                self.cmp = lambda a, b: a < b
+            else:
+                self.cmp = lambda a, b: b < a
+
+        def push(self, item):
+            """Offers one item to the accumulator."""
+            k = self.key(item) if self.key else item
+            # The arrival counter breaks ties so that earlier items win, like a stable sort.
+            entry = (k, -self.count) if self.largest else (k, self.count)
+            self.count += 1
+            keys, vals = self.keys, self.vals
+            if len(keys) < self.k:
+                keys.append(entry)
+                vals.append(item)
+                SortingAlgorithms._sift_up(keys, vals, len(keys) - 1, 0, self.cmp)
+            elif self.k and self.cmp(keys[0], entry):
+                keys[0] = entry
+                vals[0] = item
+                SortingAlgorithms._sift_down(keys, vals, 0, 0, len(keys), self.cmp)
+
+        def extend(self, iterable):
+            """Offers every item of an iterable, consuming it lazily."""
+            for item in iterable:
+                self.push(item)
+            return self
+
+        def result(self):
+            """Returns the current top-k items, best first."""
+            keys, vals = self.keys[:], self.vals[:]
+            SortingAlgorithms._heap_sort_range(keys, vals, 0, len(keys), self.cmp)
+            return vals
+
+    @staticmethod
+    def nsmallest(iterable, k, key=None):
+        """Returns the k smallest items of any iterable using O(k) memory."""
+        if k <= 0:
+            return []
+        return SortingAlgorithms.TopK(k, key=key).extend(iterable).result()
+
+    @staticmethod
+    def nlargest(iterable, k, key=None):
+        """Returns the k largest items of any iterable using O(k) memory."""
+        if k <= 0:
+            return []
+        return SortingAlgorithms.TopK(k, key=key, largest=True).extend(iterable).result()
+
+    @staticmethod
+    def lsd_radix_sort(arr, digit_bits=8):
+        """Sorts a list or array.array of ints or floats in place with a byte-wise LSD radix sort.
+
+        Negative ints are biased by the minimum and floats are mapped to order-preserving unsigned
+        64-bit keys, so only the keys are moved. Two ping-pong buffers are reused across passes and
+        passes where every key has the same digit are skipped. A list mixing ints and floats raises
+        TypeError, since float keys cannot represent every int exactly. NumPy arrays are sorted in
+        place with NumPy's stable sort.
+        """
+        if digit_bits not in (8, 16):
+            raise ValueError("digit_bits must be 8 or 16.")
+        if np is not None and isinstance(arr, np.ndarray):
+            # NumPy's stable sort radix-sorts small ints itself and is far faster than one argsort per digit.
+            arr.sort(kind='stable')
+            return arr
+        n = len(arr)
+        if n < 2:
+            return arr
+
+        typecode = getattr(arr, "typecode", None)
+        if typecode is None:
+            floats = sum(isinstance(x, float) for x in arr)
+            if 0 < floats < n:
+                raise TypeError("Cannot radix sort a mix of ints and floats; convert them to one type first.")
+            is_float = floats == n
+        else:
+            is_float = typecode in ("f", "d")
+        sign_bit = 1 << 63
+        if is_float:
+            # IEEE 754 trick: flip all bits of negatives, set the sign bit of non-negatives.
+            raw = array.array('Q', array.array('d', arr).tobytes())
+            keys = array.array('Q', [~b & 0xFFFFFFFFFFFFFFFF if b & sign_bit else b | sign_bit for b in raw])
+            width = 64
+        else:
+            low = min(arr)
+            width = (max(arr) - low).bit_length()
+            biased = [x - low for x in arr]
+            keys = array.array('Q', biased) if width <= 64 else biased
+
+        radix = 1 << digit_bits
+        mask = radix - 1
+        src = keys
+        dst = keys[:]
+        for shift in range(0, width, digit_bits):
+            count = [0] * radix
+            for k in src:
+                count[(k >> shift) & mask] += 1
+            if count[(src[0] >> shift) & mask] == n:
+                continue
+            total = 0
+            for d in range(radix):
+                count[d], total = total, total + count[d]
+            for k in src:
+                d = (k >> shift) & mask
+                dst[count[d]] = k
+                count[d] += 1
+            src, dst = dst, src
+
+        if is_float:
+            bits = array.array('Q', [b ^ sign_bit if b & sign_bit else ~b & 0xFFFFFFFFFFFFFFFF for b in src])
+            result = array.array('d', bits.tobytes()).tolist()
+        else:
+            result = [k + low for k in src]
+        if typecode is not None:
+            arr[:] = array.array(typecode, result)
+        else:
+            arr[:] = result
+        return arr
+
+    @staticmethod
+    def counting_sort(arr):
+        """Sorts an array of integers in place with Counting Sort (vectorized for NumPy arrays)."""
+        n = len(arr)
+        if n < 2:
+            return arr
+        if np is not None and isinstance(arr, np.ndarray):
+            # Widen before offsetting so narrow dtypes such as int8 cannot wrap around.
+            low, high = int(arr.min()), int(arr.max())
+            counts = np.bincount((arr.astype(np.int64) - low).astype(np.intp), minlength=high - low + 1)
+            arr[...] = np.repeat(np.arange(low, high + 1, dtype=np.int64), counts)
+            return arr
+        low, high = min(arr), max(arr)
+        count = [0] * (high - low + 1)
+        for x in arr:
+            count[x - low] += 1
+        i = 0
+        for value, c in enumerate(count, low):
+            arr[i:i + c] = [value] * c
+            i += c
+        return arr
+
+    @staticmethod
+    def msd_radix_sort(arr):
+        """Sorts a list of str or bytes keys in place with an iterative MSD radix sort."""
+        stack = [(0, len(arr), 0)]
+        while stack:
+            lo, hi, d = stack.pop()
+            if hi - lo <= SortingAlgorithms.INSERTION_SORT_CUTOFF:
+                SortingAlgorithms._insertion_sort_range(arr, None, lo, hi)
+                continue
+            buckets = {}
+            for s in arr[lo:hi]:
+                # An empty slice marks an exhausted key, which sorts before every character.
+                buckets.setdefault(s[d:d + 1], []).append(s)
+            if len(buckets) == 1:
+                digit = next(iter(buckets))
+                if digit:
+                    stack.append((lo, hi, d + 1))
+                continue
+            pos = lo
+            for digit in sorted(buckets):
+                bucket = buckets[digit]
+                arr[pos:pos + len(bucket)] = bucket
+                if digit and len(bucket) > 1:
+                    stack.append((pos, pos + len(bucket), d + 1))
+                pos += len(bucket)
+        return arr
+    
+    @staticmethod
+    def benchmark(n=20000):
+        """Times the adaptive Tim Sort against Merge Sort on several input shapes."""
+        def timed(fn, data):
+            start = time.perf_counter()
+            fn(data)
+            return time.perf_counter() - start
+
+        inputs = {
+            "random": [random.randint(0, n) for _ in range(n)],
+            "sorted": list(range(n)),
+            "reversed": list(range(n, 0, -1)),
+            "sawtooth": [i % 1000 for i in range(n)],
+        }
+        print(f"Sorting benchmark (n={n}):")
+        for name, data in inputs.items():
+            merge_time = timed(SortingAlgorithms.merge_sort, data.copy())
+            tim_time = timed(SortingAlgorithms.tim_sort, data.copy())
+            print(f"  {name:<10} merge_sort: {merge_time:.4f}s  tim_sort: {tim_time:.4f}s  "
+                  f"speedup: {merge_time / tim_time:.1f}x")
+
+        data = inputs["random"] * 10
+        baseline = timed(SortingAlgorithms.merge_sort, data.copy())
+        print(f"Parallel sample sort (n={len(data)}, merge_sort: {baseline:.4f}s):")
+        cores = os.cpu_count() or 1
+        workers = 1
+        while True:
+            elapsed = timed(lambda d: SortingAlgorithms.parallel_sort(d, workers=workers), data.copy())
+            print(f"  {workers:>3} workers: {elapsed:.4f}s  speedup: {baseline / elapsed:.1f}x")
+            if workers >= cores:
+                break
+            workers = min(workers * 2, cores)
     
     @staticmethod
     def main():
@@ -167,6 +1009,46 @@ class SortingAlgorithms:
         
         # Test Radix Sort
         print("Radix Sort:", SortingAlgorithms.radix_sort(arr.copy()))
+        
+        # Test Tim Sort
+        print("Tim Sort:", SortingAlgorithms.tim_sort(arr.copy()))
+        print("Tim Sort (reverse, key=x % 7):", SortingAlgorithms.tim_sort(arr.copy(), key=lambda x: x % 7, reverse=True))
+        print("Tim Sort (array):", SortingAlgorithms.tim_sort(array.array('q', list(range(100, 0, -3)) + arr)))
+        
+        # Test External Merge Sort (tiny memory limit to force several runs)
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "input.bin")
+            dst = os.path.join(tmp, "output.bin")
+            with open(src, "wb") as f:
+                array.array('q', arr).tofile(f)
+            SortingAlgorithms.external_sort(src, dst, memory_limit=128, typecode='q')
+            with open(dst, "rb") as f:
+                print("External Merge Sort:", array.array('q', f.read()).tolist())
+        
+        # Test Parallel Sample Sort (min_parallel_size=0 forces the multi-process path)
+        print("Parallel Sample Sort:", SortingAlgorithms.parallel_sort(arr.copy(), workers=2, min_parallel_size=0))
+        print("Parallel Sample Sort (array, single-process fallback):", SortingAlgorithms.parallel_sort(array.array('q', arr), workers=1))
+        
+        # Test Intro Sort on a slice, with a key
+        print("Intro Sort (arr[2:6] by -x):", SortingAlgorithms.intro_sort(arr.copy(), 2, 6, key=lambda x: -x))
+        
+        # Test LSD Radix Sort on negatives and floats, MSD Radix Sort on strings
+        print("LSD Radix Sort (ints):", SortingAlgorithms.lsd_radix_sort([-5, 300, 0, -70000, 42, 7]))
+        print("LSD Radix Sort (floats):", SortingAlgorithms.lsd_radix_sort(array.array('d', [2.5, -0.5, -3.0, 1e9, 0.0]), digit_bits=16))
+        print("MSD Radix Sort:", SortingAlgorithms.msd_radix_sort(["banana", "apple", "band", "ban", "cherry", "apricot"]))
+        
+        # Test Selection / Top-K
+        print("Quick Select (median):", SortingAlgorithms.quick_select(arr.copy(), len(arr) // 2))
+        print("3 Smallest:", SortingAlgorithms.nsmallest(iter(arr), 3))
+        print("3 Largest:", SortingAlgorithms.nlargest(iter(arr), 3))
+        print("-1 Smallest:", SortingAlgorithms.nsmallest(iter(arr), -1))
+        
+        # Test Counting Sort (and the NumPy backend when available)
+        print("Counting Sort:", SortingAlgorithms.counting_sort(arr.copy()))
+        if np is not None:
+            print("Counting Sort (NumPy):", SortingAlgorithms.counting_sort(np.array(arr)))
+            print("Counting Sort (NumPy int8):", SortingAlgorithms.counting_sort(np.array([127, -128, 5, -1], dtype=np.int8)))
+            print("LSD Radix Sort (NumPy):", SortingAlgorithms.lsd_radix_sort(np.array([3.5, -1.25, 0.0, -7.0])))
 
 
 # Main function to test the sorting algorithms
@@ -1,11 +1,13 @@
 #string_algorithms.py
 
+import heapq
+
 class StringAlgorithms:
     """
     ### String Algorithms:
     1. String Matching Algorithms (Knuth-Morris-Pratt (KMP))
     2. Rabin-Karp Algorithm
-    3. Trie Data Structure
+    3. Trie Data Structure (with fuzzy top-k lookup)
     4. Suffix Array/Suffix Tree
     5. Z Algorithm
     """
@@ -114,6 +116,45 @@ class StringAlgorithms:
                     return False
                 node = node.children[char]
             return True
+
+        def fuzzy_search(self, word, max_distance, limit=None):
+            """Returns up to limit (distance, word) pairs within max_distance edits of word, closest first.
+
+            Walks the trie once, deriving each node's edit distance row from its parent's so words sharing
+            a prefix share the DP work; subtrees whose row minimum exceeds the bound are pruned. Once limit
+            matches are held, the bound tightens to the worst of them.
+            """
+            if limit is not None and limit <= 0:
+                return []
+            best = []  # max-heap of (-distance, word) when limit is set
+            bound = max_distance
+            columns = len(word) + 1
+            stack = [(self.root, "", list(range(columns)))]
+            while stack:
+                node, prefix, row = stack.pop()
+                if node.is_end_of_word and row[-1] <= bound:
+                    if limit is None:
+                        best.append((row[-1], prefix))
+                    elif len(best) < limit:
+                        heapq.heappush(best, (-row[-1], prefix))
+                    elif row[-1] < -best[0][0]:
+                        heapq.heapreplace(best, (-row[-1], prefix))
+                    if limit is not None and len(best) == limit:
+                        bound = min(max_distance, -best[0][0])
+                if min(row) > bound:
+                    continue
+                for char, child in node.children.items():
+                    next_row = [row[0] + 1]
+                    for j in range(1, columns):
+                        if word[j - 1] == char:
+                            next_row.append(row[j - 1])
+                        else:
+                            next_row.append(1 + min(row[j - 1], row[j], next_row[j - 1]))
+                    if min(next_row) <= bound:
+                        stack.append((child, prefix + char, next_row))
+            if limit is not None:
+                best = [(-distance, match) for distance, match in best]
+            return sorted(best)[:limit]
     
     
     @staticmethod
@@ -222,6 +263,11 @@ class StringAlgorithms:
         print("Trie Search (app):", trie.search("app"))
         print("Trie Search (apple):", trie.search("apple"))
         print("Trie Starts With (ap):", trie.starts_with("ap"))
+        trie.insert("apply")
+        trie.insert("ample")
+        print("Trie Fuzzy Search (appel, 2):", trie.fuzzy_search("appel", 2))
+        print("Trie Fuzzy Search (appel, 2, top 1):", trie.fuzzy_search("appel", 2, limit=1))
+        print("Trie Fuzzy Search (appel, 2, top 0):", trie.fuzzy_search("appel", 2, limit=0))
 
         # Test Suffix Array
         text = "banana"